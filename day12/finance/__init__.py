@@ -1 +1,2 @@
-from .income import add_income
+from .income import add_income, add_incomes_bulk
+from .expense import add_expense, add_expenses_bulk
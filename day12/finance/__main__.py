@@ -0,0 +1,16 @@
+# finance/__main__.py
+# python -m finance                  -> interactive tracker
+# python -m finance rebuild [path]   -> regenerate summary cubes from the ledger
+
+import os
+import sys
+
+from .main import main, DEFAULT_LEDGER_PATH
+from .rollup import rebuild
+
+if len(sys.argv) > 1 and sys.argv[1] == "rebuild":
+    path = sys.argv[2] if len(sys.argv) > 2 else os.environ.get("FINANCE_LEDGER") or DEFAULT_LEDGER_PATH
+    rows = rebuild(path)
+    print(f"Rebuilt cubes from {rows} transactions: {path}.cube")
+else:
+    main()
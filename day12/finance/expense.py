@@ -1,12 +1,24 @@
 
-expenses = []
+from money import from_paise
+from .ledger import ledger
+from .store import EXPENSE
+
+expenses = ledger.expenses
 
 def add_expense(amount, category):
-    expenses.append({"amount": amount, "category": category})
+    ledger.add_expense(amount, category)
     print(f"Expense added: ₹{amount} for {category}")
 
 def get_total_expense():
-    total = 0
-    for expense in expenses:
-        total += expense["amount"]
-    return total
+    return from_paise(ledger.expense_paise)
+
+def get_expenses_by_category():
+    return {k: from_paise(v) for k, v in ledger.expense_by_category.items()}
+
+def add_expenses_bulk(rows):
+    """
+    Import many expenses at once, e.g. from csv.reader / csv.DictReader.
+    Rows are (amount, category[, date]) or dicts; nothing is printed per row.
+    Returns an import report (see Ledger.add_bulk).
+    """
+    return ledger.add_bulk(EXPENSE, rows)
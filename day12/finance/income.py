@@ -1,12 +1,24 @@
 
-incomes = []
+from money import from_paise
+from .ledger import ledger
+from .store import INCOME
+
+incomes = ledger.incomes
 
 def add_income(amount, source):
-    incomes.append({"amount": amount, "source": source})
+    ledger.add_income(amount, source)
     print(f"Income added: ₹{amount} from {source}")
 
 def get_total_income():
-    total = 0
-    for income in incomes:
-        total += income["amount"]
-    return total
+    return from_paise(ledger.income_paise)
+
+def get_income_by_source():
+    return {k: from_paise(v) for k, v in ledger.income_by_source.items()}
+
+def add_incomes_bulk(rows):
+    """
+    Import many incomes at once, e.g. from csv.reader / csv.DictReader.
+    Rows are (amount, source[, date]) or dicts; nothing is printed per row.
+    Returns an import report (see Ledger.add_bulk).
+    """
+    return ledger.add_bulk(INCOME, rows)
@@ -0,0 +1,179 @@
+# finance/ledger.py
+
+import math
+import time
+from datetime import date, datetime
+
+from money import from_paise, to_paise
+from .rollup import Rollup
+from .store import LedgerFile, INCOME, EXPENSE
+
+# LedgerFile stores paise as int64
+PAISE_LIMIT = 2 ** 63
+# unix seconds that datetime (years 1..9999) can turn into a local date
+TS_MIN, TS_MAX = -62135510400, 253402214400
+
+class Ledger:
+    """
+    Keeps running totals so summaries don't rescan every transaction.
+    All totals are exact integer paise; total_income/total_expense give rupees.
+    """
+
+    def __init__(self):
+        self.incomes = []
+        self.expenses = []
+        self.income_paise = 0
+        self.expense_paise = 0
+        self.income_by_source = {}      # source -> paise
+        self.expense_by_category = {}   # category -> paise
+        self.store = None
+        self.rollup = Rollup()
+
+    def attach(self, path):
+        """
+        Persist to the append-only ledger file at `path`, loading its totals.
+        Rows already on disk are not loaded into incomes/expenses; those lists
+        only hold transactions added in this session.
+        """
+        if self.store is not None:
+            self.store.close()
+        self.store = LedgerFile(path)
+        agg = self.store.aggregates()
+        self.income_paise = agg["income"]
+        self.expense_paise = agg["expense"]
+        self.income_by_source = agg["by_source"]
+        self.expense_by_category = agg["by_category"]
+        self.rollup = Rollup.open(self.store)
+
+    def close(self):
+        if self.store is not None:
+            self.rollup.save(f"{self.store.path}.cube")
+            self.store.close()
+            self.store = None
+
+    @property
+    def total_income(self):
+        return from_paise(self.income_paise)
+
+    @property
+    def total_expense(self):
+        return from_paise(self.expense_paise)
+
+    def add_income(self, amount, source):
+        paise = to_paise(amount)
+        self._record(INCOME, paise, source)
+        self.incomes.append({"amount": amount, "source": source})
+        self.income_paise += paise
+        self.income_by_source[source] = self.income_by_source.get(source, 0) + paise
+
+    def add_expense(self, amount, category):
+        paise = to_paise(amount)
+        self._record(EXPENSE, paise, category)
+        self.expenses.append({"amount": amount, "category": category})
+        self.expense_paise += paise
+        self.expense_by_category[category] = self.expense_by_category.get(category, 0) + paise
+
+    def _record(self, kind, paise, name):
+        """Write one transaction to the file, then the rollup; totals are the caller's."""
+        if abs(paise) >= PAISE_LIMIT:
+            raise ValueError(f"bad amount: {paise} paise is out of range")
+        ts = int(time.time())
+        if self.store is not None:
+            self.store.append(kind, paise, name, ts=ts)
+        self.rollup.add(ts, kind, name, paise)
+
+    def add_bulk(self, kind, rows, max_errors=100):
+        """
+        Validate and append many transactions of one kind without printing.
+
+        Each row is a tuple/list (amount, name[, when]) or a dict with
+        "amount", "source"/"category" and optional "timestamp" or "date".
+        `when` may be unix seconds, an ISO date/datetime string, or a
+        date/datetime.  Bad rows are skipped and reported, not raised.
+
+        With a ledger file attached, rows go straight to the file (not to
+        the in-session incomes/expenses lists).
+        Returns {"accepted", "rejected", "errors": [(row number, reason)], "elapsed_s"}.
+        """
+        start = time.perf_counter()
+        name_key = "source" if kind == INCOME else "category"
+        now = int(time.time())
+        good, errors = [], []
+        rejected = 0
+        seen_dates = {}   # statement dates repeat a lot; parse each once
+
+        for i, row in enumerate(rows, 1):
+            try:
+                if isinstance(row, dict):
+                    amount, name = row["amount"], row[name_key]
+                    when = row.get("timestamp") or row.get("date")
+                else:
+                    amount, name = row[0], row[1]
+                    when = row[2] if len(row) > 2 else None
+                if isinstance(amount, str):
+                    amount = amount.strip().replace(",", "")
+                    paise = to_paise(amount)   # exact decimal parse
+                else:
+                    amount = float(amount)
+                    if not math.isfinite(amount):
+                        raise ValueError(f"bad amount {amount}")
+                    paise = to_paise(amount)
+                if paise < 0 or paise >= PAISE_LIMIT:
+                    raise ValueError(f"bad amount {amount}")
+                name = str(name).strip()
+                if not name:
+                    raise ValueError(f"empty {name_key}")
+                ts = seen_dates.get(when) if isinstance(when, str) else None
+                if ts is None:
+                    ts = _to_ts(when, now)
+                    if not TS_MIN <= ts <= TS_MAX:
+                        raise ValueError(f"bad date {when!r}")
+                    if isinstance(when, str):
+                        seen_dates[when] = ts
+                good.append((ts, paise, name))
+            except (ValueError, TypeError, KeyError, IndexError, ArithmeticError) as e:
+                rejected += 1
+                if len(errors) < max_errors:
+                    errors.append((i, str(e)))
+
+        # file first: if the write fails, totals and rollup are left untouched
+        if self.store is not None:
+            self.store.append_many(kind, good)
+        else:
+            rows_list = self.incomes if kind == INCOME else self.expenses
+            rows_list.extend({"amount": from_paise(paise), name_key: name} for _, paise, name in good)
+
+        by_name = self.income_by_source if kind == INCOME else self.expense_by_category
+        total = 0
+        for ts, paise, name in good:
+            by_name[name] = by_name.get(name, 0) + paise
+            total += paise
+        self.rollup.add_rows(kind, good)
+        if kind == INCOME:
+            self.income_paise += total
+        else:
+            self.expense_paise += total
+
+        return {"accepted": len(good), "rejected": rejected, "errors": errors,
+                "elapsed_s": time.perf_counter() - start}
+
+    def savings_paise(self):
+        return self.income_paise - self.expense_paise
+
+def _to_ts(when, default):
+    if when is None or when == "":
+        return default
+    if isinstance(when, datetime):
+        return int(when.timestamp())
+    if isinstance(when, date):
+        return int(datetime(when.year, when.month, when.day).timestamp())
+    if isinstance(when, (int, float)):
+        return int(when)
+    when = str(when).strip()
+    try:
+        return int(float(when))
+    except ValueError:
+        return int(datetime.fromisoformat(when).timestamp())
+
+# shared by income.py, expense.py and summary.py
+ledger = Ledger()
@@ -1,33 +1,61 @@
 # finance/main.py
 
+import os
+from pathlib import Path
+
+from .ledger import ledger
 from .income import add_income
 from .expense import add_expense
-from .summary import show_summary
+from .summary import show_summary, show_breakdown, show_monthly_trend
+
+# override with the FINANCE_LEDGER environment variable
+DEFAULT_LEDGER_PATH = Path.home() / ".finance" / "ledger.bin"
+
+def main(ledger_path=None):
+    ledger.attach(ledger_path or os.environ.get("FINANCE_LEDGER") or DEFAULT_LEDGER_PATH)
+    try:
+        menu()
+    finally:
+        ledger.close()
 
-def main():
+def menu():
     while True:
         print("\n=== Personal Finance Tracker ===")
         print("1. Add Income")
         print("2. Add Expense")
         print("3. View Summary")
-        print("4. Exit")
+        print("4. View Breakdown")
+        print("5. View Monthly Trend")
+        print("6. Exit")
 
         choice = input("Enter your choice: ")
 
         if choice == "1":
-            amount = float(input("Enter income amount: "))
-            source = input("Enter income source: ")
-            add_income(amount, source)
+            try:
+                amount = float(input("Enter income amount: "))
+                source = input("Enter income source: ")
+                add_income(amount, source)
+            except ValueError as e:
+                print(f"Invalid amount: {e}")
 
         elif choice == "2":
-            amount = float(input("Enter expense amount: "))
-            category = input("Enter expense category: ")
-            add_expense(amount, category)
+            try:
+                amount = float(input("Enter expense amount: "))
+                category = input("Enter expense category: ")
+                add_expense(amount, category)
+            except ValueError as e:
+                print(f"Invalid amount: {e}")
 
         elif choice == "3":
             show_summary()
 
         elif choice == "4":
+            show_breakdown()
+
+        elif choice == "5":
+            show_monthly_trend()
+
+        elif choice == "6":
             print("Thank you! Exiting...")
             break
 
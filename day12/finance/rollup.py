@@ -0,0 +1,235 @@
+# finance/rollup.py
+"""
+Pre-aggregated time buckets for finance summaries.
+
+Every transaction is added to a day, a month and a year bucket (local
+time), each keyed by (kind, source/category).  Queries walk only the
+buckets that cover the requested range: whole years, then whole months,
+then the leftover days at either end.  Their cost depends on the number of
+buckets, not the number of transactions.
+
+Cubes are saved next to the ledger file as "<path>.cube" and can be rebuilt
+from the raw records at any time:
+
+    python -m finance rebuild [ledger path]
+"""
+
+import json
+import os
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from pathlib import Path
+
+from .store import INCOME, EXPENSE, LedgerFile, group_sums
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+GRANULARITIES = ("day", "month", "year")
+
+@lru_cache(maxsize=4096)
+def period_keys(d):
+    """("2025-03-14", "2025-03", "2025") for a date."""
+    return (d.isoformat(), f"{d.year:04d}-{d.month:02d}", f"{d.year:04d}")
+
+def quarter(year, q):
+    """(start, end) dates of a calendar quarter; end is exclusive."""
+    start = date(year, 3 * (q - 1) + 1, 1)
+    end = date(year + 1, 1, 1) if q == 4 else date(year, 3 * q + 1, 1)
+    return start, end
+
+def _next_month(d):
+    return date(d.year + 1, 1, 1) if d.month == 12 else date(d.year, d.month + 1, 1)
+
+def _cover(start, end):
+    """Bucket keys ("day"/"month"/"year", key) exactly covering [start, end)."""
+    d = start
+    while d < end:
+        if d.month == 1 and d.day == 1 and date(d.year + 1, 1, 1) <= end:
+            yield "year", f"{d.year:04d}"
+            d = date(d.year + 1, 1, 1)
+        elif d.day == 1 and _next_month(d) <= end:
+            yield "month", f"{d.year:04d}-{d.month:02d}"
+            d = _next_month(d)
+        else:
+            yield "day", d.isoformat()
+            d += timedelta(days=1)
+
+class Rollup:
+    def __init__(self):
+        # granularity -> period key -> {(kind, name): paise}
+        self.cubes = {g: {} for g in GRANULARITIES}
+        self.rows = 0
+
+    def add(self, ts, kind, name, paise):
+        for g, key in zip(GRANULARITIES, period_keys(datetime.fromtimestamp(ts).date())):
+            bucket = self.cubes[g].setdefault(key, {})
+            bucket[(kind, name)] = bucket.get((kind, name), 0) + paise
+        self.rows += 1
+
+    def add_rows(self, kind, rows):
+        """Add (ts, paise, name) rows of one kind (bulk imports)."""
+        day_of_slot = {}
+        for ts, paise, name in rows:
+            slot = ts // 900
+            d = day_of_slot.get(slot)
+            if d is None:
+                d = day_of_slot[slot] = datetime.fromtimestamp(ts).date()
+            self._add_many(d, kind, name, paise)
+            self.rows += 1
+
+    def _add_many(self, d, kind, name, paise):
+        for g, key in zip(GRANULARITIES, period_keys(d)):
+            bucket = self.cubes[g].setdefault(key, {})
+            bucket[(kind, name)] = bucket.get((kind, name), 0) + paise
+
+    def update_from(self, store: LedgerFile):
+        """Fold in records appended to `store` since this rollup last saw it."""
+        total = len(store)
+        if total <= self.rows:
+            return
+        if np is None:
+            from .store import RECORD
+            with open(store.path, "rb") as f:
+                f.seek(self.rows * RECORD.size)
+                for ts, paise, kind, name in RECORD.iter_unpack(f.read()):
+                    self._add_many(datetime.fromtimestamp(ts).date(), kind, store.names[name], paise)
+            self.rows = total
+            return
+
+        recs = store.records()[self.rows:total]
+        # local day of each row: resolve each distinct 15-minute slot once
+        # (UTC offsets are multiples of 15 minutes), never each row
+        slot = recs["ts"] // 900
+        first = int(slot.min())
+        slot -= first
+        if int(slot.max()) < max(4 * len(slot), 1 << 20):
+            # distinct slots by counting, not sorting (the usual, compact case)
+            slots = np.flatnonzero(np.bincount(slot))
+            slot_idx = np.zeros(int(slots[-1]) + 1, dtype=np.int64)
+            slot_idx[slots] = np.arange(len(slots))
+            slot_idx = slot_idx[slot]
+        else:
+            slots, slot_idx = np.unique(slot, return_inverse=True)
+        slot_days = [datetime.fromtimestamp((first + s) * 900).date() for s in slots.tolist()]
+        days = sorted(set(slot_days))
+        day_no = {d: i for i, d in enumerate(days)}
+        row_day = np.array([day_no[d] for d in slot_days], dtype=np.int64)[slot_idx]
+
+        # key = day * width + name * 2 + kind; the rows are summed per day,
+        # then months and years are summed from those day groups
+        names = store.names
+        width = 2 * len(names)
+        keys, sums = group_sums(row_day * width + recs["name"] * 2 + recs["kind"], recs["paise"])
+        try:
+            sums = np.array(sums, dtype=np.int64)
+        except OverflowError:
+            # a day group past int64: add the groups one by one, as Python ints
+            for k, paise in zip(keys, sums):
+                d, item = divmod(k, width)
+                self._add_many(days[d], item % 2, names[item // 2], paise)
+            self.rows = total
+            return
+        day_of_key, item_of_key = np.divmod(np.array(keys, dtype=np.int64), width)
+        periods = [period_keys(d) for d in days]
+        for g, level in enumerate(GRANULARITIES):
+            labels = sorted({p[g] for p in periods})
+            label_no = {label: i for i, label in enumerate(labels)}
+            of_day = np.array([label_no[p[g]] for p in periods], dtype=np.int64)
+            cube = self.cubes[level]
+            for k, paise in zip(*group_sums(of_day[day_of_key] * width + item_of_key, sums)):
+                b, item = divmod(k, width)
+                bucket = cube.setdefault(labels[b], {})
+                item = (item % 2, names[item // 2])
+                bucket[item] = bucket.get(item, 0) + paise
+        self.rows = total
+
+    @classmethod
+    def rebuild(cls, store: LedgerFile):
+        rollup = cls()
+        rollup.update_from(store)
+        return rollup
+
+    # --- queries -------------------------------------------------------
+
+    def totals(self, start, end, kind):
+        """{name: paise} for one kind over [start, end)."""
+        out = {}
+        for g, key in _cover(start, end):
+            for (k, name), paise in self.cubes[g].get(key, {}).items():
+                if k == kind:
+                    out[name] = out.get(name, 0) + paise
+        return out
+
+    def expenses_by_category(self, start, end):
+        return self.totals(start, end, EXPENSE)
+
+    def income_by_source(self, start, end):
+        return self.totals(start, end, INCOME)
+
+    def monthly(self, months=12, until=None):
+        """
+        Last `months` calendar months up to and including `until`'s month:
+        [(month key, income paise, expense paise, savings paise)].
+        """
+        until = until or date.today()
+        y, m = until.year, until.month
+        keys = []
+        for _ in range(months):
+            keys.append(f"{y:04d}-{m:02d}")
+            y, m = (y - 1, 12) if m == 1 else (y, m - 1)
+        out = []
+        for key in reversed(keys):
+            inc = exp = 0
+            for (kind, _), paise in self.cubes["month"].get(key, {}).items():
+                if kind == INCOME:
+                    inc += paise
+                else:
+                    exp += paise
+            out.append((key, inc, exp, inc - exp))
+        return out
+
+    # --- persistence ---------------------------------------------------
+
+    def save(self, path):
+        data = {"rows": self.rows,
+                "cubes": {g: {key: [[k, name, paise] for (k, name), paise in bucket.items()]
+                              for key, bucket in cube.items()}
+                          for g, cube in self.cubes.items()}}
+        tmp = Path(f"{path}.tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        rollup = cls()
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        rollup.rows = data["rows"]
+        for g in GRANULARITIES:
+            rollup.cubes[g] = {key: {(k, name): paise for k, name, paise in items}
+                               for key, items in data["cubes"][g].items()}
+        return rollup
+
+    @classmethod
+    def open(cls, store: LedgerFile):
+        """Load the store's saved cube and catch up; rebuild if missing or stale."""
+        try:
+            rollup = cls.load(f"{store.path}.cube")
+            if rollup.rows > len(store):
+                raise ValueError("cube is ahead of the ledger")
+        except (OSError, ValueError, KeyError, TypeError):
+            rollup = cls()
+        rollup.update_from(store)
+        return rollup
+
+def rebuild(path):
+    """Regenerate "<path>.cube" from the raw ledger; returns the row count."""
+    store = LedgerFile(path)
+    try:
+        rollup = Rollup.rebuild(store)
+        rollup.save(f"{store.path}.cube")
+    finally:
+        store.close()
+    return rollup.rows
@@ -0,0 +1,198 @@
+# finance/store.py
+"""
+Append-only binary ledger file.
+
+Every transaction is one fixed-width 24-byte record:
+
+    timestamp (int64, unix seconds) | amount (int64, paise) |
+    kind (uint8: 0 income, 1 expense) | 3 pad bytes | name id (int32)
+
+Source/category names are interned; the id -> name table lives next to the
+ledger in "<path>.names", one name per line, in id order.
+
+Opening memory-maps the file and aggregates it with numpy straight from
+the mapped bytes, so no Python object is created per row.  Without numpy
+it falls back to struct.iter_unpack (same result, just slower).  A small
+"<path>.agg" checkpoint, refreshed on close, means later opens only scan
+rows appended after it.
+"""
+
+import json
+import mmap
+import os
+import struct
+import time
+from pathlib import Path
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+INCOME = 0
+EXPENSE = 1
+
+RECORD = struct.Struct("<qqB3xi")
+
+if np is not None:
+    RECORD_DTYPE = np.dtype([("ts", "<i8"), ("paise", "<i8"), ("kind", "u1"),
+                             ("pad", "V3"), ("name", "<i4")])
+
+# group_sums() splits values at this bit: both halves sum exactly in float64
+SPLIT_BITS = 24
+
+def group_sums(keys, values):
+    """
+    (distinct keys, exact sum of values per key) as lists, sorted by key.
+    `keys` are small non-negative ints.  No sort: np.bincount adds the low
+    SPLIT_BITS and the high bits of each value separately, and both stay
+    below 2**53 (exact in float64) for any bucket under 2**29 rows and
+    2**77 paise; the halves are recombined as Python ints.
+    """
+    values = values.astype(np.int64, copy=False)
+    counts = np.bincount(keys)
+    lo = np.bincount(keys, weights=values & ((1 << SPLIT_BITS) - 1))
+    hi = np.bincount(keys, weights=values >> SPLIT_BITS)
+    present = np.flatnonzero(counts)
+    hi, lo = hi[present], lo[present]
+    if np.abs(hi).max(initial=0) < 2 ** (62 - SPLIT_BITS):
+        # recombining fits in int64 (the usual case)
+        return present.tolist(), ((hi.astype(np.int64) << SPLIT_BITS) + lo.astype(np.int64)).tolist()
+    return present.tolist(), [(int(h) << SPLIT_BITS) + int(l) for h, l in zip(hi.tolist(), lo.tolist())]
+
+class LedgerFile:
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.names_path = Path(f"{self.path}.names")
+        self.agg_path = Path(f"{self.path}.agg")
+
+        self.names = []
+        if self.names_path.exists():
+            with open(self.names_path, "r", encoding="utf-8", newline="") as f:
+                self.names = f.read().split("\n")[:-1]
+        self.ids = {name: i for i, name in enumerate(self.names)}
+
+        self.f = open(self.path, "ab")
+        # drop a partially written trailing record, if any
+        size = self.path.stat().st_size
+        if size % RECORD.size:
+            self.f.truncate(size - size % RECORD.size)
+        self.names_f = open(self.names_path, "a", encoding="utf-8", newline="")
+
+    def close(self):
+        self.f.flush()
+        self.save_checkpoint()
+        self.f.close()
+        self.names_f.close()
+
+    def __len__(self):
+        self.f.flush()
+        return self.path.stat().st_size // RECORD.size
+
+    def intern(self, name):
+        name = str(name).replace("\n", " ")
+        i = self.ids.get(name)
+        if i is None:
+            i = self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.names_f.write(name + "\n")
+            self.names_f.flush()
+        return i
+
+    def append(self, kind, paise, name, ts=None, flush=True):
+        ts = int(time.time()) if ts is None else int(ts)
+        self.f.write(RECORD.pack(ts, paise, kind, self.intern(name)))
+        if flush:
+            self.f.flush()
+
+    def append_many(self, kind, rows):
+        """Append (ts, paise, name) rows of one kind in a single write."""
+        pack, intern = RECORD.pack, self.intern
+        self.f.write(b"".join(pack(ts, paise, kind, intern(name)) for ts, paise, name in rows))
+        self.f.flush()
+
+    def flush(self):
+        self.f.flush()
+
+    def records(self):
+        """
+        The whole file as a read-only numpy structured array backed by the
+        memory map (zero-copy).  Returns None when the file is empty.
+        """
+        self.f.flush()
+        if np is None:
+            raise RuntimeError("numpy required for records(). Install with: pip install numpy")
+        if os.path.getsize(self.path) == 0:
+            return None
+        with open(self.path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return np.frombuffer(mm, dtype=RECORD_DTYPE)
+
+    def _aggregate(self, start=0):
+        """Totals and per-name sums (paise) over records[start:]."""
+        out = {"income": 0, "expense": 0, "by_source": {}, "by_category": {}}
+        if np is None:
+            self.f.flush()
+            with open(self.path, "rb") as f:
+                f.seek(start * RECORD.size)
+                data = f.read()
+            for _, paise, kind, name in RECORD.iter_unpack(data):
+                key = "income" if kind == INCOME else "expense"
+                by = out["by_source" if kind == INCOME else "by_category"]
+                out[key] += paise
+                by[self.names[name]] = by.get(self.names[name], 0) + paise
+            return out
+
+        recs = self.records()
+        if recs is None or start >= len(recs):
+            return out
+        recs = recs[start:]
+        # one pass: bucket by (name, kind)
+        key = recs["name"].astype(np.int64) * 2 + recs["kind"]
+        for k, paise in zip(*group_sums(key, recs["paise"])):
+            name, kind = self.names[k // 2], k % 2
+            if kind == INCOME:
+                out["income"] += paise
+                out["by_source"][name] = paise
+            else:
+                out["expense"] += paise
+                out["by_category"][name] = paise
+        return out
+
+    def aggregates(self):
+        """
+        Lifetime totals and per-name sums, all in paise:
+        {"income": int, "expense": int, "by_source": {...}, "by_category": {...}}
+
+        A checkpoint of the aggregates ("<path>.agg", written by
+        save_checkpoint()) lets this scan only the records appended since.
+        """
+        rows = len(self)
+        base = self._load_checkpoint(rows)
+        start = base.pop("rows") if base else 0
+        new = self._aggregate(start)
+        if not base:
+            return new
+        for key in ("income", "expense"):
+            base[key] += new[key]
+        for key in ("by_source", "by_category"):
+            for name, paise in new[key].items():
+                base[key][name] = base[key].get(name, 0) + paise
+        return base
+
+    def _load_checkpoint(self, rows):
+        try:
+            cp = json.loads(self.agg_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(cp, dict) or not 0 <= cp.get("rows", -1) <= rows:
+            return None
+        return cp
+
+    def save_checkpoint(self):
+        agg = self.aggregates()
+        agg["rows"] = len(self)
+        tmp = Path(f"{self.agg_path}.tmp")
+        tmp.write_text(json.dumps(agg), encoding="utf-8")
+        os.replace(tmp, self.agg_path)
@@ -1,15 +1,33 @@
 # finance/summary.py
 
-from .income import get_total_income
-from .expense import get_total_expense
+from money import from_paise
+from .income import get_total_income, get_income_by_source
+from .expense import get_total_expense, get_expenses_by_category
+from .ledger import ledger
 
 def show_summary():
     total_income = get_total_income()
     total_expense = get_total_expense()
-    savings = total_income - total_expense
+    savings = from_paise(ledger.savings_paise())   # exact, no float drift
 
     print("\n------ Finance Summary ------")
     print("Total Income :", total_income)
     print("Total Expense:", total_expense)
     print("Savings      :", savings)
     print("-----------------------------\n")
+
+def show_breakdown():
+    print("\n------ Income by Source ------")
+    for source, amount in get_income_by_source().items():
+        print(f"{source:15}: {amount}")
+    print("\n----- Expense by Category -----")
+    for category, amount in get_expenses_by_category().items():
+        print(f"{category:15}: {amount}")
+    print("-------------------------------\n")
+
+def show_monthly_trend(months=12):
+    print(f"\n------ Last {months} Months ------")
+    print(f"{'Month':8} {'Income':>12} {'Expense':>12} {'Savings':>12}")
+    for month, inc, exp, sav in ledger.rollup.monthly(months):
+        print(f"{month:8} {inc / 100:>12.2f} {exp / 100:>12.2f} {sav / 100:>12.2f}")
+    print("------------------------------\n")
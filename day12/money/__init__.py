@@ -0,0 +1,21 @@
+# money/__init__.py
+"""
+Fixed-point money shared by finance and payroll.
+
+Amounts are integer paise (1 rupee = 100 paise): Python ints for scalars,
+int64 numpy arrays for columns.  Sums are exact, and rates are applied in
+integer arithmetic with one half-up rounding at the end, so no float drift
+builds up and no defensive round() calls are needed.
+"""
+
+from .core import (
+    PAISE_PER_RUPEE, RATE_SCALE,
+    to_paise, from_paise, fmt_paise, sum_paise, rate_units, apply_rate, div_round,
+    to_paise_array, from_paise_array, sum_paise_array, div_round_array,
+)
+
+__all__ = [
+    "PAISE_PER_RUPEE", "RATE_SCALE",
+    "to_paise", "from_paise", "fmt_paise", "sum_paise", "rate_units", "apply_rate", "div_round",
+    "to_paise_array", "from_paise_array", "sum_paise_array", "div_round_array",
+]
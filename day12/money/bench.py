@@ -0,0 +1,55 @@
+# money/bench.py
+"""
+Exactness and speed of paise arithmetic vs float + round().
+Usage (from day12/): python -m money.bench [N]
+"""
+
+import random
+import sys
+import time
+from decimal import Decimal
+
+from .core import sum_paise_array, to_paise, to_paise_array
+
+def run(n: int = 1_000_000, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    amounts = [round(rng.uniform(1, 100000), 2) for _ in range(n)]
+    exact = sum(Decimal(repr(a)) for a in amounts)
+
+    t0 = time.perf_counter()
+    total = 0.0
+    for a in amounts:
+        total = round(total + a, 2)
+    t_float = time.perf_counter() - t0
+
+    plain = sum(amounts)   # no rounding: drift shows up here
+
+    # both sides start from the float amounts, so conversion is timed too
+    t0 = time.perf_counter()
+    total_p = sum(to_paise(a) for a in amounts)
+    t_int = time.perf_counter() - t0
+
+    result = {"n": n, "float_round_s": t_float, "paise_sum_s": t_int,
+              "float_error": float(Decimal(repr(total)) - exact),
+              "plain_float_error": float(Decimal(repr(plain)) - exact),
+              "paise_error": float(Decimal(total_p) / 100 - exact)}
+
+    try:
+        import numpy as np
+    except Exception:
+        return result
+    arr = np.asarray(amounts)
+    t0 = time.perf_counter()
+    f = round(float(arr.sum()), 2)
+    result["numpy_float_s"] = time.perf_counter() - t0
+    result["numpy_float_error"] = float(Decimal(repr(f)) - exact)
+    t0 = time.perf_counter()
+    p = sum_paise_array(to_paise_array(arr))
+    result["numpy_paise_s"] = time.perf_counter() - t0
+    result["numpy_paise_error"] = float(Decimal(p) / 100 - exact)
+    return result
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for k, v in run(n).items():
+        print(f"{k:18}: {v}")
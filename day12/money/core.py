@@ -0,0 +1,84 @@
+# money/core.py
+import math
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from typing import Iterable, Union
+
+PAISE_PER_RUPEE = 100
+# rates are held as integer units of 1/100000 (0.001%)
+RATE_SCALE = 100_000
+
+Number = Union[int, float, str, Decimal]
+
+# --- scalars ------------------------------------------------------------
+
+def to_paise(amount: Number) -> int:
+    """
+    Rupees -> paise.  Floats go to the nearest paisa; strings and Decimals
+    are parsed exactly and rounded half-up ("1.005" -> 101).
+    Raises ValueError for anything that is not a finite amount.
+    """
+    if isinstance(amount, int):
+        return amount * PAISE_PER_RUPEE
+    if isinstance(amount, float):
+        if not math.isfinite(amount):
+            raise ValueError(f"bad amount {amount!r}")
+        return int(round(amount * PAISE_PER_RUPEE))
+    try:
+        d = amount if isinstance(amount, Decimal) else Decimal(str(amount).strip())
+    except InvalidOperation:
+        raise ValueError(f"bad amount {amount!r}") from None
+    if not d.is_finite():
+        raise ValueError(f"bad amount {amount!r}")
+    return int((d * PAISE_PER_RUPEE).to_integral_value(rounding=ROUND_HALF_UP))
+
+def from_paise(paise: int) -> float:
+    """Paise -> rupees as the float nearest to the exact 2-decimal value."""
+    return paise / PAISE_PER_RUPEE
+
+def fmt_paise(paise: int, symbol: str = "₹") -> str:
+    """Exact "₹1,234.56" formatting, no float involved."""
+    sign = "-" if paise < 0 else ""
+    rupees, p = divmod(abs(paise), PAISE_PER_RUPEE)
+    return f"{sign}{symbol}{rupees:,}.{p:02d}"
+
+def sum_paise(amounts: Iterable[Number]) -> int:
+    return sum(to_paise(a) for a in amounts)
+
+def rate_units(rate: float) -> int:
+    """0.05 -> 5000.  Raises ValueError for rates finer than 1/RATE_SCALE."""
+    units = round(rate * RATE_SCALE)
+    if abs(units - rate * RATE_SCALE) > 1e-6:
+        raise ValueError(f"rate {rate} is finer than 1/{RATE_SCALE}")
+    return int(units)
+
+def div_round(n: int, d: int) -> int:
+    """n / d rounded half away from zero, in exact integer arithmetic."""
+    q = (abs(n) + d // 2) // d
+    return q if n >= 0 else -q
+
+def apply_rate(paise: int, units: int) -> int:
+    """paise * rate, rounded to the nearest paisa (half-up)."""
+    return div_round(paise * units, RATE_SCALE)
+
+# --- arrays (numpy) -----------------------------------------------------
+
+def to_paise_array(values):
+    """float rupees -> int64 paise, nearest paisa."""
+    import numpy as np
+    return np.rint(np.asarray(values, dtype=np.float64) * PAISE_PER_RUPEE).astype(np.int64)
+
+def from_paise_array(paise):
+    import numpy as np
+    return np.asarray(paise, dtype=np.int64) / PAISE_PER_RUPEE
+
+def sum_paise_array(paise) -> int:
+    """Exact total of an int64 paise array, as a Python int."""
+    import numpy as np
+    return int(np.asarray(paise, dtype=np.int64).sum(dtype=np.int64))
+
+def div_round_array(n, d: int):
+    """Vectorized div_round() on int64 arrays."""
+    import numpy as np
+    n = np.asarray(n, dtype=np.int64)
+    q = (np.abs(n) + d // 2) // d
+    return np.where(n >= 0, q, -q)
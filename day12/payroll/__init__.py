@@ -2,5 +2,7 @@
 """Employee payroll package exports."""
 
 from .payslip import generate_payslip, run_cli
+from .bulk import generate_payslips_bulk
+from .incremental import run_incremental
 
-__all__ = ["generate_payslip", "run_cli"]
+__all__ = ["generate_payslip", "generate_payslips_bulk", "run_cli", "run_incremental"]
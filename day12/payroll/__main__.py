@@ -0,0 +1,49 @@
+# payroll/__main__.py
+"""
+python -m payroll                 -> interactive single payslip (run_cli)
+python -m payroll batch --input employees.jsonl [--out ...] [--summary ...]
+"""
+
+import argparse
+import sys
+from datetime import datetime
+
+def parse_args(argv=None) -> argparse.Namespace:
+    now = datetime.now()
+    p = argparse.ArgumentParser(prog="payroll", description="Employee payroll")
+    sub = p.add_subparsers(dest="command")
+    b = sub.add_parser("batch", help="Run payroll for every employee in a CSV/JSONL file")
+    b.add_argument("--input", required=True, help="employees file (.csv or .jsonl)")
+    b.add_argument("--month", default=now.strftime("%B"), help="Month name (default: current)")
+    b.add_argument("--year", type=int, default=now.year, help="Year (default: current)")
+    b.add_argument("--out", help="Payslip archive (.tar[.gz], .zip, or concatenated .txt; "
+                                 "default payslips_<month>_<year>.tar)")
+    b.add_argument("--summary", help="Summary CSV path")
+    b.add_argument("--chunk-size", type=int, default=1000, help="Employees per chunk")
+    b.add_argument("--tax-schedule", help="JSON tax schedule (see TaxSchedule.from_file)")
+    return p.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.command != "batch":
+        from .payslip import run_cli
+        run_cli()
+        return
+
+    from .runner import run_batch
+    from .tax import TaxSchedule
+
+    try:
+        schedule = TaxSchedule.from_file(args.tax_schedule) if args.tax_schedule else None
+        r = run_batch(args.input, args.month, args.year, out=args.out,
+                      summary=args.summary, chunk_size=args.chunk_size, schedule=schedule)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+    print(f"Processed {r['rows']} employees in {r['elapsed_s']:.2f}s "
+          f"({r['rows_per_s']:,.0f} rows/s)")
+    print(f"Payslips: {r['out']}")
+    print(f"Summary : {r['summary']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+# payroll/batch.py
+"""
+Columnar payroll: compute breakdowns for a whole workforce in one pass.
+
+Inputs are parallel columns (base salary, summed allowances, summed
+deductions); outputs are NumPy arrays with the same keys as
+salary.breakdown().  Requires numpy (pip install numpy).
+"""
+
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from money import from_paise_array, to_paise_array
+from .employee import Employee
+from .table import EmployeeTable
+from .tax import TaxSchedule, default_schedule
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("numpy required for batch payroll. Install with: pip install numpy")
+
+def to_columns(employees: Union[Iterable[Employee], EmployeeTable]) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Flatten employees into (base_salary, allowances, deductions) float64 columns."""
+    _require_numpy()
+    if isinstance(employees, EmployeeTable):
+        return employees.columns()
+    base, allow, deduct = [], [], []
+    for e in employees:
+        base.append(e.base_salary)
+        allow.append(e.total_allowances())
+        deduct.append(e.total_deductions())
+    return (np.asarray(base, dtype=np.float64),
+            np.asarray(allow, dtype=np.float64),
+            np.asarray(deduct, dtype=np.float64))
+
+def compute_tax_batch(gross, schedule: Optional[TaxSchedule] = None) -> "np.ndarray":
+    """Vectorized compute_tax() over a gross-income column."""
+    _require_numpy()
+    return (schedule or default_schedule()).compute_many(gross)
+
+def breakdown_batch_paise(base_salary, allowances, deductions,
+                          schedule: Optional[TaxSchedule] = None) -> Dict[str, "np.ndarray"]:
+    """
+    Column-wise equivalent of salary.breakdown_paise(): int64 paise arrays.
+    Gross and tax are computed once per employee and reused for net.
+    """
+    _require_numpy()
+    base_salary = np.asarray(base_salary, dtype=np.float64)
+    allowances = np.asarray(allowances, dtype=np.float64)
+
+    gross = to_paise_array(base_salary + allowances)
+    tax = (schedule or default_schedule()).compute_many_paise(gross)
+    deductions = to_paise_array(deductions)
+    return {"gross": gross, "tax": tax, "deductions": deductions,
+            "net": gross - tax - deductions}
+
+def breakdown_batch(base_salary, allowances, deductions,
+                    schedule: Optional[TaxSchedule] = None) -> Dict[str, "np.ndarray"]:
+    """Column-wise equivalent of salary.breakdown(): float rupee arrays."""
+    bd = breakdown_batch_paise(base_salary, allowances, deductions, schedule)
+    return {k: from_paise_array(v) for k, v in bd.items()}
+
+def breakdown_employees(employees: Iterable[Employee],
+                        schedule: Optional[TaxSchedule] = None) -> Dict[str, "np.ndarray"]:
+    """Convenience wrapper: to_columns() followed by breakdown_batch()."""
+    return breakdown_batch(*to_columns(employees), schedule=schedule)
@@ -0,0 +1,6 @@
+# payroll/benchmarks/__init__.py
+"""
+Throughput benchmarks for the payroll hot paths.
+Run from day12/: python -m payroll.benchmarks (full suite, JSON output)
+or a single comparison, e.g. python -m payroll.benchmarks.bench_batch
+"""
@@ -0,0 +1,118 @@
+# payroll/benchmarks/__main__.py
+"""
+Payroll benchmark suite.
+
+    python -m payroll.benchmarks --sizes 1k,100k --json results.json
+
+Scenarios per size: compute_tax, breakdown, generate_payslip, save_text and
+the full `payroll batch` path (JSONL in, archive + summary CSV out).
+Each is timed without tracing, then re-run under tracemalloc for the
+Python heap peak (skip with --no-memory).  save_text is capped at
+--max-files files so large sizes don't flood the filesystem.
+"""
+
+import argparse
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from ..helpers import now_str, save_text
+from ..payslip import generate_payslip
+from ..runner import run_batch
+from ..salary import breakdown, calc_gross
+from ..tax import compute_tax
+from .workforce import SIZES, make_employees, write_jsonl
+
+def _scenarios(n: int, seed: int, workdir: Path, max_files: int) -> Dict[str, Callable[[], int]]:
+    """name -> callable returning the number of operations it performed."""
+    employees = make_employees(n, seed)
+    incomes = [calc_gross(e) for e in employees]
+    generated = now_str()
+    slips = [generate_payslip(e, "March", 2025, generated=generated)
+             for e in employees[:max_files]]
+    jsonl = workdir / f"employees_{n}.jsonl"
+    write_jsonl(jsonl, n, seed)
+
+    def tax():
+        for x in incomes:
+            compute_tax(x)
+        return n
+
+    def bd():
+        for e in employees:
+            breakdown(e)
+        return n
+
+    def payslip():
+        for e in employees:
+            generate_payslip(e, "March", 2025, generated=generated)
+        return n
+
+    def save():
+        d = workdir / "slips"
+        for i, text in enumerate(slips):
+            save_text(str(d / f"{i}.txt"), text)
+        return len(slips)
+
+    def cli_batch():
+        r = run_batch(str(jsonl), "March", 2025, out=str(workdir / "slips.txt"),
+                      summary=str(workdir / "summary.csv"))
+        return r["rows"]
+
+    return {"compute_tax": tax, "breakdown": bd, "generate_payslip": payslip,
+            "save_text": save, "cli_batch": cli_batch}
+
+def run(sizes: List[str], seed: int = 42, memory: bool = True, max_files: int = 10_000) -> dict:
+    results = []
+    for label in sizes:
+        n = SIZES[label]
+        with tempfile.TemporaryDirectory(prefix="payroll-bench-") as tmp:
+            for name, fn in _scenarios(n, seed, Path(tmp), max_files).items():
+                t0 = time.perf_counter()
+                ops = fn()
+                secs = time.perf_counter() - t0
+                peak = None
+                if memory:
+                    tracemalloc.start()
+                    fn()
+                    peak = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+                results.append({"scenario": name, "size": label, "n": ops,
+                                "seconds": round(secs, 6),
+                                "ops_per_s": round(ops / secs, 1) if secs else None,
+                                "peak_mem_bytes": peak})
+                print(f"{label:>5} {name:17} {secs:9.3f}s {ops / secs if secs else 0:>12,.0f} ops/s"
+                      + (f" {peak / 1e6:8.1f} MB" if peak is not None else ""), file=sys.stderr)
+    return {"timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(), "platform": platform.platform(),
+            "seed": seed, "results": results}
+
+def main(argv=None):
+    p = argparse.ArgumentParser(prog="payroll.benchmarks", description="Payroll benchmarks")
+    p.add_argument("--sizes", default="1k,100k", help=f"comma list of {', '.join(SIZES)}")
+    p.add_argument("--seed", type=int, default=42)
+    p.add_argument("--json", dest="json_out", help="write results here (default: stdout)")
+    p.add_argument("--no-memory", action="store_true", help="skip the tracemalloc pass")
+    p.add_argument("--max-files", type=int, default=10_000, help="cap for the save_text scenario")
+    args = p.parse_args(argv)
+
+    sizes = [s.strip().lower() for s in args.sizes.split(",") if s.strip()]
+    unknown = [s for s in sizes if s not in SIZES]
+    if unknown:
+        p.error(f"unknown size(s): {', '.join(unknown)}")
+
+    report = run(sizes, seed=args.seed, memory=not args.no_memory, max_files=args.max_files)
+    text = json.dumps(report, indent=2)
+    if args.json_out:
+        Path(args.json_out).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# payroll/benchmarks/bench_batch.py
+"""
+Per-employee salary.breakdown() vs columnar batch.breakdown_batch().
+Usage: python -m payroll.benchmarks.bench_batch [N]
+"""
+
+import sys
+import time
+
+from ..salary import breakdown
+from ..batch import to_columns, breakdown_batch
+from .workforce import make_employees
+
+KEYS = ("gross", "tax", "deductions", "net")
+
+def run(n: int = 100_000) -> dict:
+    employees = make_employees(n)
+
+    t0 = time.perf_counter()
+    slow = [breakdown(e) for e in employees]
+    t_loop = time.perf_counter() - t0
+
+    cols = to_columns(employees)
+    t0 = time.perf_counter()
+    fast = breakdown_batch(*cols)
+    t_batch = time.perf_counter() - t0
+
+    # results must agree to the paisa
+    max_diff = 0.0
+    for k in KEYS:
+        for i, bd in enumerate(slow):
+            max_diff = max(max_diff, abs(bd[k] - float(fast[k][i])))
+
+    return {"n": n, "loop_s": t_loop, "batch_s": t_batch,
+            "speedup": t_loop / t_batch if t_batch else float("inf"),
+            "max_abs_diff": max_diff}
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    r = run(n)
+    print(f"employees : {r['n']}")
+    print(f"per-employee breakdown(): {r['loop_s']:.3f}s")
+    print(f"breakdown_batch()       : {r['batch_s']:.3f}s ({r['speedup']:.1f}x)")
+    print(f"max abs diff            : {r['max_abs_diff']:.4f}")
+    if r["max_abs_diff"] >= 0.005:
+        sys.exit("batch results differ from breakdown() by a paisa or more")
@@ -0,0 +1,70 @@
+# payroll/benchmarks/bench_template.py
+"""
+Slips/second: the original line-by-line payslip builder vs the compiled
+PayslipTemplate that generate_payslip() now uses.
+Usage: python -m payroll.benchmarks.bench_template [N]
+"""
+
+import sys
+import time
+
+from ..helpers import fmt_currency, now_str
+from ..salary import breakdown
+from ..template import DEFAULT_TEMPLATE
+from .workforce import make_employees
+
+def legacy_payslip(employee, month, year, generated):
+    # the pre-template generate_payslip() body, kept as the baseline
+    bd = breakdown(employee)
+    lines = []
+    lines.append("=== Company XYZ Pvt Ltd ===")
+    lines.append(f"Payslip for: {employee.name} (ID: {employee.emp_id})")
+    lines.append(f"Period: {month} {year}")
+    lines.append(f"Generated: {generated}")
+    lines.append("-" * 30)
+    lines.append(f"Base Salary : {fmt_currency(employee.base_salary)}")
+    lines.append("Allowances:")
+    if employee.allowances:
+        for k, v in employee.allowances.items():
+            lines.append(f"  {k:12} : {fmt_currency(v)}")
+    else:
+        lines.append("  (none)")
+    lines.append(f"Gross Salary: {fmt_currency(bd['gross'])}")
+    lines.append("-" * 30)
+    lines.append("Deductions:")
+    if employee.deductions:
+        for k, v in employee.deductions.items():
+            lines.append(f"  {k:12} : {fmt_currency(v)}")
+    else:
+        lines.append("  (none)")
+    lines.append(f"Tax         : {fmt_currency(bd['tax'])}")
+    lines.append(f"Total Deduct: {fmt_currency(bd['deductions'])}")
+    lines.append("-" * 30)
+    lines.append(f"Net Pay     : {fmt_currency(bd['net'])}")
+    lines.append("-" * 30)
+    return "\n".join(lines)
+
+def run(n: int = 50_000) -> dict:
+    employees = make_employees(n)
+    generated = now_str()
+    t0 = time.perf_counter()
+    old = [legacy_payslip(e, "March", 2025, generated) for e in employees]
+    t_legacy = time.perf_counter() - t0
+
+    render = DEFAULT_TEMPLATE.render
+    t0 = time.perf_counter()
+    new = [render(e, breakdown(e), "March", 2025, generated) for e in employees]
+    t_render = time.perf_counter() - t0
+
+    if old != new:
+        raise AssertionError("template output differs from legacy payslip")
+
+    return {"n": n, "legacy_slips_per_s": n / t_legacy,
+            "template_slips_per_s": n / t_render}
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    r = run(n)
+    print(f"slips           : {r['n']}")
+    print(f"legacy   slips/s: {r['legacy_slips_per_s']:,.0f}")
+    print(f"template slips/s: {r['template_slips_per_s']:,.0f}")
@@ -0,0 +1,69 @@
+# payroll/benchmarks/workforce.py
+"""
+Seeded synthetic employees for benchmarks.
+
+Employees are drawn from a few pay grades with typical Indian salary
+components: HRA and DA as a share of base, fixed conveyance/medical,
+PF at 12% of base (capped), professional tax, occasional insurance/loan.
+Amounts are banded the way a real payroll is, so values repeat.
+"""
+
+import json
+import random
+from typing import Iterator, List
+
+from ..employee import Employee
+
+SIZES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+
+# (name, weight, base salary range, step)
+GRADES = [
+    ("junior", 0.55, (15000, 40000), 500),
+    ("mid", 0.30, (40000, 100000), 1000),
+    ("senior", 0.12, (100000, 250000), 5000),
+    ("exec", 0.03, (250000, 800000), 10000),
+]
+
+def _employee(i: int, rng: random.Random) -> Employee:
+    grade, _, (lo, hi), step = rng.choices(GRADES, weights=[g[1] for g in GRADES])[0]
+    base = float(rng.randrange(lo, hi, step))
+
+    allowances = {"HRA": round(base * rng.choice((0.4, 0.5)), 2)}
+    if rng.random() < 0.6:
+        allowances["DA"] = round(base * 0.1, 2)
+    if rng.random() < 0.7:
+        allowances["Conveyance"] = 1600.0
+    if rng.random() < 0.5:
+        allowances["Medical"] = 1250.0
+    if grade in ("senior", "exec") and rng.random() < 0.5:
+        allowances["Special"] = float(rng.randrange(5000, 50000, 2500))
+
+    deductions = {"PF": min(round(base * 0.12, 2), 1800.0)}
+    if rng.random() < 0.9:
+        deductions["ProfTax"] = 200.0
+    if rng.random() < 0.3:
+        deductions["Insurance"] = float(rng.choice((500, 750, 1000, 1500)))
+    if rng.random() < 0.1:
+        deductions["Loan"] = float(rng.randrange(1000, 15000, 500))
+
+    return Employee(emp_id=f"E{i:07d}", name=f"Employee {i}", base_salary=base,
+                    allowances=allowances, deductions=deductions)
+
+def iter_employees(n: int, seed: int = 42) -> Iterator[Employee]:
+    """Yield n employees; the same seed always gives the same workforce."""
+    rng = random.Random(seed)
+    for i in range(n):
+        yield _employee(i, rng)
+
+def make_employees(n: int, seed: int = 42) -> List[Employee]:
+    return list(iter_employees(n, seed))
+
+def write_jsonl(path, n: int, seed: int = 42) -> None:
+    """Write a workforce in the format read by payroll.records.read_jsonl()."""
+    with open(path, "w", encoding="utf-8") as f:
+        for e in iter_employees(n, seed):
+            f.write(json.dumps({"emp_id": e.emp_id, "name": e.name,
+                                "base_salary": e.base_salary,
+                                "allowances": e.allowances,
+                                "deductions": e.deductions}))
+            f.write("\n")
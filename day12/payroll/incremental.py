@@ -0,0 +1,133 @@
+# payroll/incremental.py
+"""
+Incremental payroll runs.
+
+A state file remembers, per employee, a digest of their pay data, their
+last breakdown() and where their rendered slip body lives in a companion
+"<state>.bodies" file.  run_incremental() only recomputes and re-renders
+employees whose digest changed (or everyone, if the tax schedule or the
+payslip template changed); the rest reuse the stored breakdown and body,
+with a fresh header for the new period.
+
+State layout (JSON):
+    {"schedule": "<schedule digest>/<template digest>",
+     "records": {"<emp_id>": [digest, gross, tax, deductions, net, offset, length]}}
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from .bulk import _open_sink
+from .employee import Employee
+from .helpers import now_str
+from .salary import breakdown
+from .tax import TaxSchedule, default_schedule
+from .template import DEFAULT_TEMPLATE, PayslipTemplate
+
+BD_KEYS = ("gross", "tax", "deductions", "net")
+
+def employee_digest(employee: Employee) -> str:
+    """Digest of everything that feeds breakdown() and the slip body."""
+    key = repr((employee.emp_id, employee.name, employee.base_salary,
+                tuple(employee.allowances.items()), tuple(employee.deductions.items())))
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+def _load_state(path: Path) -> dict:
+    if not path.exists():
+        return {"schedule": None, "records": {}}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {"schedule": None, "records": {}}
+
+def _save_state(path: Path, state: dict) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, path)
+
+def _compact(bodies_path: Path, records: Dict[str, list]) -> None:
+    """Rewrite the bodies file keeping only bodies still referenced."""
+    tmp = bodies_path.with_name(bodies_path.name + ".tmp")
+    with open(bodies_path, "rb") as src, open(tmp, "wb") as dst:
+        offset = 0
+        for rec in records.values():
+            src.seek(rec[5])
+            dst.write(src.read(rec[6]))
+            rec[5] = offset
+            offset += rec[6]
+    os.replace(tmp, bodies_path)
+
+def run_incremental(employees: Iterable[Employee], month: str, year: int,
+                    state: str = "payroll_state.json", out: Optional[str] = None,
+                    schedule: Optional[TaxSchedule] = None,
+                    template: PayslipTemplate = DEFAULT_TEMPLATE) -> Dict[str, float]:
+    """
+    Run payroll for `employees`, reusing last run's results where possible.
+
+    If `out` is given, full payslips are written there (same formats as
+    generate_payslips_bulk).  Employees missing from this run are dropped
+    from the state.  Returns {"total", "recomputed", "skipped", "elapsed_s"}.
+    """
+    start = time.perf_counter()
+    schedule = schedule or default_schedule()
+    state_path = Path(state)
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    bodies_path = state_path.with_name(state_path.name + ".bodies")
+
+    old = _load_state(state_path)
+    # stored bodies are only valid for the schedule and template that made them
+    run_digest = f"{schedule.digest()}/{template.digest()}"
+    old_records = old["records"] if old.get("schedule") == run_digest and bodies_path.exists() else {}
+    if not old_records and bodies_path.exists():
+        bodies_path.unlink()
+
+    records: Dict[str, list] = {}
+    recomputed = skipped = 0
+    generated = now_str()
+    sink = _open_sink(Path(out)) if out else None
+
+    with open(bodies_path, "ab+") as bodies:
+        end = bodies.seek(0, os.SEEK_END)
+        view = mmap.mmap(bodies.fileno(), 0, access=mmap.ACCESS_READ) if end else None
+        try:
+            for e in employees:
+                digest = employee_digest(e)
+                rec = old_records.get(e.emp_id)
+                if rec is not None and rec[0] == digest:
+                    skipped += 1
+                    body = view[rec[5]:rec[5] + rec[6]].decode("utf-8") if sink else None
+                else:
+                    recomputed += 1
+                    bd = breakdown(e, schedule)
+                    body = template.render_body(e, bd)
+                    data = body.encode("utf-8")
+                    bodies.write(data)
+                    rec = [digest] + [bd[k] for k in BD_KEYS] + [end, len(data)]
+                    end += len(data)
+                records[e.emp_id] = rec
+                if sink:
+                    text = template.render_header(e, month, year, generated) + body
+                    sink.add(f"{e.emp_id}_{month}_{year}.txt", e.emp_id, text.encode("utf-8"))
+        finally:
+            if view is not None:
+                view.close()
+            if sink:
+                sink.close()
+
+    live = sum(r[6] for r in records.values())
+    if end > 2 * live:
+        _compact(bodies_path, records)
+
+    _save_state(state_path, {"schedule": run_digest, "records": records})
+    return {"total": recomputed + skipped, "recomputed": recomputed,
+            "skipped": skipped, "elapsed_s": time.perf_counter() - start}
+
+def load_breakdowns(state: str = "payroll_state.json") -> Dict[str, Dict[str, float]]:
+    """Last stored breakdown() per emp_id."""
+    records = _load_state(Path(state))["records"]
+    return {emp_id: dict(zip(BD_KEYS, rec[1:5])) for emp_id, rec in records.items()}
@@ -1,43 +1,19 @@
 # payroll/payslip.py
 from .employee import Employee
 from .salary import breakdown as salary_breakdown   # alias import
-from .helpers import fmt_currency, save_text, now_str
-from typing import Dict
+from .helpers import save_text
+from .template import DEFAULT_TEMPLATE
+from typing import Dict, Optional
 
-def generate_payslip(employee: Employee, month: str, year: int, save: bool = False) -> str:
+def generate_payslip(employee: Employee, month: str, year: int, save: bool = False,
+                     generated: Optional[str] = None) -> str:
     """
     Returns a formatted payslip string for the employee.
     If save=True, saves a .txt in payslips/<emp_id>_<month>_<year>.txt
+    `generated` overrides the timestamp line (bulk runs pass one per batch).
     """
     bd: Dict[str, float] = salary_breakdown(employee)
-    lines = []
-    lines.append("=== Company XYZ Pvt Ltd ===")
-    lines.append(f"Payslip for: {employee.name} (ID: {employee.emp_id})")
-    lines.append(f"Period: {month} {year}")
-    lines.append(f"Generated: {now_str()}")
-    lines.append("-" * 30)
-    lines.append(f"Base Salary : {fmt_currency(employee.base_salary)}")
-    lines.append("Allowances:")
-    if employee.allowances:
-        for k, v in employee.allowances.items():
-            lines.append(f"  {k:12} : {fmt_currency(v)}")
-    else:
-        lines.append("  (none)")
-    lines.append(f"Gross Salary: {fmt_currency(bd['gross'])}")
-    lines.append("-" * 30)
-    lines.append("Deductions:")
-    if employee.deductions:
-        for k, v in employee.deductions.items():
-            lines.append(f"  {k:12} : {fmt_currency(v)}")
-    else:
-        lines.append("  (none)")
-    lines.append(f"Tax         : {fmt_currency(bd['tax'])}")
-    lines.append(f"Total Deduct: {fmt_currency(bd['deductions'])}")
-    lines.append("-" * 30)
-    lines.append(f"Net Pay     : {fmt_currency(bd['net'])}")
-    lines.append("-" * 30)
-
-    text = "\n".join(lines)
+    text = DEFAULT_TEMPLATE.render(employee, bd, month, year, generated)
 
     if save:
         filename = f"payslips/{employee.emp_id}_{month}_{year}.txt"
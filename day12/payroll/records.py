@@ -0,0 +1,73 @@
+# payroll/records.py
+"""
+Streaming employee readers for batch runs.
+
+JSONL: one object per line
+    {"emp_id": "E001", "name": "Asha", "base_salary": 30000,
+     "allowances": {"HRA": 2000}, "deductions": {"PF": 1500}}
+
+CSV: emp_id,name,base_salary plus one column per component, named
+"allowance.<name>" or "deduction.<name>"; empty cells are skipped.
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Dict, Iterator
+
+from .employee import Employee
+
+ALLOWANCE_PREFIX = "allowance."
+DEDUCTION_PREFIX = "deduction."
+
+def _amounts(d) -> Dict[str, float]:
+    return {str(k): float(v) for k, v in (d or {}).items()}
+
+def read_jsonl(path) -> Iterator[Employee]:
+    with open(path, "r", encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                rec = json.loads(line)
+                yield Employee(emp_id=str(rec["emp_id"]), name=rec.get("name", ""),
+                               base_salary=float(rec["base_salary"]),
+                               allowances=_amounts(rec.get("allowances")),
+                               deductions=_amounts(rec.get("deductions")))
+            except (ValueError, KeyError, TypeError, AttributeError) as e:
+                raise ValueError(f"{path}:{lineno}: bad employee record ({e})") from None
+
+def read_csv(path) -> Iterator[Employee]:
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return
+        col = {name: i for i, name in enumerate(header)}
+        try:
+            i_id, i_name, i_base = col["emp_id"], col.get("name"), col["base_salary"]
+        except KeyError as e:
+            raise ValueError(f"{path}: missing column {e}") from None
+        allow_cols = [(i, h[len(ALLOWANCE_PREFIX):]) for i, h in enumerate(header)
+                      if h.startswith(ALLOWANCE_PREFIX)]
+        deduct_cols = [(i, h[len(DEDUCTION_PREFIX):]) for i, h in enumerate(header)
+                       if h.startswith(DEDUCTION_PREFIX)]
+
+        for lineno, row in enumerate(reader, 2):
+            if not row:
+                continue
+            try:
+                yield Employee(emp_id=row[i_id],
+                               name=row[i_name] if i_name is not None else "",
+                               base_salary=float(row[i_base]),
+                               allowances={k: float(row[i]) for i, k in allow_cols if row[i]},
+                               deductions={k: float(row[i]) for i, k in deduct_cols if row[i]})
+            except (ValueError, IndexError) as e:
+                raise ValueError(f"{path}:{lineno}: bad employee record ({e})") from None
+
+def read_employees(path) -> Iterator[Employee]:
+    """Pick the reader from the file suffix (.csv, otherwise JSON lines)."""
+    if Path(path).suffix.lower() == ".csv":
+        return read_csv(path)
+    return read_jsonl(path)
@@ -0,0 +1,63 @@
+# payroll/runner.py
+"""
+Non-interactive batch payroll run: stream employees from a file, write
+payslips into one archive and a summary CSV, in constant memory.
+"""
+
+import csv
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+from .bulk import _chunks, _open_sink
+from .helpers import now_str
+from .records import read_employees
+from .salary import breakdown
+from .tax import TaxSchedule
+from .template import DEFAULT_TEMPLATE
+
+SUMMARY_FIELDS = ["emp_id", "name", "gross", "tax", "deductions", "net"]
+
+def run_batch(input_path: str, month: str, year: int, out: Optional[str] = None,
+              summary: Optional[str] = None, chunk_size: int = 1000,
+              schedule: Optional[TaxSchedule] = None) -> Dict[str, float]:
+    """
+    Process every employee in `input_path` (.csv or .jsonl).
+    Payslips go to `out` (default payslips_<month>_<year>.tar, which like
+    concatenated output keeps memory constant; a .zip grows with the
+    number of slips), the summary to `summary` (default
+    summary_<month>_<year>.csv).
+    Returns {"rows", "elapsed_s", "rows_per_s", "out", "summary"}.
+    """
+    out = out or f"payslips_{month}_{year}.tar"
+    summary = summary or f"summary_{month}_{year}.csv"
+    for p in (out, summary):
+        Path(p).parent.mkdir(parents=True, exist_ok=True)
+
+    generated = now_str()
+    render = DEFAULT_TEMPLATE.render
+    rows = 0
+    start = time.perf_counter()
+
+    sink = _open_sink(Path(out))
+    try:
+        with open(summary, "w", encoding="utf-8", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(SUMMARY_FIELDS)
+            for chunk in _chunks(read_employees(input_path), chunk_size):
+                summary_rows = []
+                for e in chunk:
+                    bd = breakdown(e, schedule)
+                    text = render(e, bd, month, year, generated)
+                    sink.add(f"{e.emp_id}_{month}_{year}.txt", e.emp_id, text.encode("utf-8"))
+                    summary_rows.append((e.emp_id, e.name, bd["gross"], bd["tax"],
+                                         bd["deductions"], bd["net"]))
+                writer.writerows(summary_rows)
+                rows += len(chunk)
+    finally:
+        sink.close()
+
+    elapsed = time.perf_counter() - start
+    return {"rows": rows, "elapsed_s": elapsed,
+            "rows_per_s": rows / elapsed if elapsed else 0.0,
+            "out": out, "summary": summary}
@@ -1,29 +1,34 @@
 # payroll/salary.py
 from .employee import Employee
-from .tax import compute_tax
+from typing import Dict, Optional
+
+from money import from_paise, to_paise
+from .tax import TaxSchedule, default_schedule
 
 # exported alias names (used by payslip)
 def calc_gross(employee: Employee) -> float:
     """Gross salary = base + allowances"""
     return employee.base_salary + employee.total_allowances()
 
-def calc_net(employee: Employee) -> float:
+def calc_net(employee: Employee, schedule: Optional[TaxSchedule] = None) -> float:
     """
     Net salary = gross - tax - other deductions
     where tax is computed based on gross
     """
-    gross = calc_gross(employee)
-    tax = compute_tax(gross)
-    other_deductions = employee.total_deductions()
-    net = gross - tax - other_deductions
-    return round(net, 2)
+    return from_paise(breakdown_paise(employee, schedule)["net"])
+
+def breakdown_paise(employee: Employee, schedule: Optional[TaxSchedule] = None) -> Dict[str, int]:
+    """breakdown() in integer paise: gross and tax computed once, all sums exact."""
+    gross = to_paise(calc_gross(employee))
+    tax = (schedule or default_schedule()).compute_paise(gross)
+    deductions = to_paise(employee.total_deductions())
+    return {"gross": gross, "tax": tax, "deductions": deductions,
+            "net": gross - tax - deductions}
 
-def breakdown(employee: Employee):
-    gross = calc_gross(employee)
-    tax = compute_tax(gross)
-    return {
-        "gross": round(gross, 2),
-        "tax": round(tax, 2),
-        "deductions": round(employee.total_deductions(), 2),
-        "net": calc_net(employee)
-    }
+def breakdown(employee: Employee, schedule: Optional[TaxSchedule] = None):
+    """
+    Gross, tax, deductions and net for one employee. Accepts an Employee
+    or anything with the same interface, e.g. an EmployeeTable row.
+    """
+    bd = breakdown_paise(employee, schedule)
+    return {k: from_paise(v) for k, v in bd.items()}
@@ -0,0 +1,113 @@
+# payroll/simulate.py
+"""
+What-if tax simulation: evaluate K candidate bracket schedules against N
+gross incomes at once.
+
+All arithmetic is int64 paise, exactly as TaxSchedule.compute_paise().
+Schedules are padded to a common number of slabs and stacked, so a chunk of
+incomes is taxed under every schedule in one broadcast operation.  Incomes
+are processed in chunks sized to keep the K x chunk x slabs working set
+under `max_cells`, so N = 1M stays within a few hundred MB at most.
+Requires numpy.
+"""
+
+from typing import Dict, List, Sequence, Tuple, Union
+
+from money import RATE_SCALE, div_round_array, from_paise, from_paise_array, to_paise_array
+from .tax import TaxSchedule
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+ScheduleLike = Union[TaxSchedule, Sequence[Tuple[float, float]]]
+
+def _require_numpy():
+    if np is None:
+        raise RuntimeError("numpy required for tax simulation. Install with: pip install numpy")
+
+def _stack(schedules: Sequence[ScheduleLike]):
+    """(K, M) int64 lowers / rate units / scaled base tax, padded with never-reached lowers."""
+    scheds = [s if isinstance(s, TaxSchedule) else TaxSchedule(s) for s in schedules]
+    if not scheds:
+        raise ValueError("need at least one schedule")
+    m = max(len(s.lowers) for s in scheds)
+    lowers = np.full((len(scheds), m), np.iinfo(np.int64).max, dtype=np.int64)
+    units = np.zeros((len(scheds), m), dtype=np.int64)
+    base_scaled = np.zeros((len(scheds), m), dtype=np.int64)
+    for k, s in enumerate(scheds):
+        n = len(s.lowers)
+        lowers[k, :n], units[k, :n], base_scaled[k, :n] = s.arrays()
+    return scheds, lowers, units, base_scaled
+
+def _tax_chunk(x, lowers, units, base_scaled):
+    """Tax in paise for paise incomes x under every schedule: (K, len(x))."""
+    # slab index per (schedule, income): number of lower bounds <= income, minus one
+    idx = (lowers[:, None, :] <= x[None, :, None]).sum(axis=2) - 1
+    np.maximum(idx, 0, out=idx)
+    rows = np.arange(lowers.shape[0])[:, None]
+    scaled = base_scaled[rows, idx] + (x[None, :] - lowers[rows, idx]) * units[rows, idx]
+    return div_round_array(scaled, RATE_SCALE)
+
+def _chunk_size(k: int, m: int, max_cells: int) -> int:
+    return max(1, max_cells // max(1, k * m))
+
+def tax_matrix(schedules: Sequence[ScheduleLike], incomes, max_cells: int = 4_000_000):
+    """Full K x N tax matrix, rounded like compute_tax(). Use for modest N."""
+    _require_numpy()
+    _, lowers, units, base_scaled = _stack(schedules)
+    x = to_paise_array(incomes)
+    step = _chunk_size(*lowers.shape, max_cells)
+    out = np.empty((lowers.shape[0], x.size), dtype=np.int64)
+    for lo in range(0, x.size, step):
+        out[:, lo:lo + step] = _tax_chunk(x[lo:lo + step], lowers, units, base_scaled)
+    return from_paise_array(out)
+
+def simulate(schedules: Sequence[ScheduleLike], incomes,
+             percentiles: Sequence[float] = (10, 50, 90, 99),
+             max_cells: int = 4_000_000) -> List[Dict]:
+    """
+    Per-scenario aggregates for every schedule:
+        total_tax, mean_effective_rate (mean of tax / income over income > 0)
+        and tax_percentiles {p: tax}.
+
+    Percentiles use the "nearest" sample: since tax never decreases with
+    income (rates must be >= 0), the p-th tax is simply the tax on the p-th
+    income, so no K x N matrix is ever materialised.
+    """
+    _require_numpy()
+    scheds, lowers, units, base_scaled = _stack(schedules)
+    if (units < 0).any():
+        raise ValueError("simulate() needs non-negative rates")
+    x = to_paise_array(incomes)
+    k = lowers.shape[0]
+
+    total = [0] * k
+    rate_sum = np.zeros(k)
+    positive = 0
+    step = _chunk_size(k, lowers.shape[1], max_cells)
+    for lo in range(0, x.size, step):
+        xc = x[lo:lo + step]
+        tax = _tax_chunk(xc, lowers, units, base_scaled)
+        for i, t in enumerate(tax.sum(axis=1, dtype=np.int64).tolist()):
+            total[i] += t   # exact: Python ints never overflow
+        pos = xc > 0
+        positive += int(pos.sum())
+        rate_sum += (tax[:, pos] / xc[pos]).sum(axis=1)
+
+    if x.size:
+        ps = np.percentile(x, percentiles, method="nearest")
+        pct_tax = from_paise_array(_tax_chunk(ps, lowers, units, base_scaled))
+    else:
+        pct_tax = np.zeros((k, len(percentiles)))
+
+    results = []
+    for i, s in enumerate(scheds):
+        results.append({
+            "schedule": s.brackets,
+            "total_tax": from_paise(total[i]),
+            "mean_effective_rate": float(rate_sum[i] / positive) if positive else 0.0,
+            "tax_percentiles": {p: float(v) for p, v in zip(percentiles, pct_tax[i])},
+        })
+    return results
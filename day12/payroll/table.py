@@ -0,0 +1,179 @@
+# payroll/table.py
+"""
+Compact, array-backed employee store.
+
+Instead of one dataclass and two dicts per employee, an EmployeeTable keeps
+typed columns (array module) and stores allowances/deductions as CSR-style
+sparse rows: an offsets column plus parallel (component id, amount) columns.
+Component names ("HRA", "PF", ...) are interned into a small vocabulary.
+
+Rows are handed out as lightweight EmployeeRow views that behave like
+Employee, so salary.breakdown() and generate_payslip() accept them as-is.
+"""
+
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .employee import Employee
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+class _SparseColumn:
+    """CSR storage for one dict-valued column (allowances or deductions)."""
+
+    def __init__(self):
+        self.indptr = array("q", [0])
+        self.comp = array("i")
+        self.amount = array("d")
+
+    def append(self, items: Optional[Dict[str, float]], vocab: "ComponentVocab") -> None:
+        if items:
+            for name, amt in items.items():
+                self.comp.append(vocab.intern(name))
+                self.amount.append(amt)
+        self.indptr.append(len(self.amount))
+
+    def row_total(self, i: int) -> float:
+        return sum(self.amount[self.indptr[i]:self.indptr[i + 1]])
+
+    def row_dict(self, i: int, vocab: "ComponentVocab") -> Dict[str, float]:
+        lo, hi = self.indptr[i], self.indptr[i + 1]
+        names = vocab.names
+        return {names[c]: a for c, a in zip(self.comp[lo:hi], self.amount[lo:hi])}
+
+    def totals(self):
+        """Per-row sums as a float64 numpy array (list without numpy)."""
+        n = len(self.indptr) - 1
+        if np is None:
+            return [self.row_total(i) for i in range(n)]
+        out = np.zeros(n, dtype=np.float64)
+        # copies, so the underlying arrays stay appendable afterwards
+        amounts = np.array(self.amount, dtype=np.float64)
+        indptr = np.array(self.indptr, dtype=np.int64)
+        nonempty = np.flatnonzero(indptr[1:] > indptr[:-1])
+        if nonempty.size:
+            out[nonempty] = np.add.reduceat(amounts, indptr[:-1][nonempty])
+        return out
+
+class ComponentVocab:
+    """Interns allowance/deduction names to small integer ids."""
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.ids: Dict[str, int] = {}
+
+    def intern(self, name: str) -> int:
+        i = self.ids.get(name)
+        if i is None:
+            i = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return i
+
+class EmployeeRow:
+    """Read-only, Employee-compatible view of one table row."""
+
+    __slots__ = ("_table", "_i")
+
+    def __init__(self, table: "EmployeeTable", i: int):
+        self._table = table
+        self._i = i
+
+    @property
+    def emp_id(self) -> str:
+        return self._table.emp_ids[self._i]
+
+    @property
+    def name(self) -> str:
+        return self._table.names[self._i]
+
+    @property
+    def base_salary(self) -> float:
+        return self._table.base_salary[self._i]
+
+    @property
+    def allowances(self) -> Dict[str, float]:
+        return self._table.allowances.row_dict(self._i, self._table.vocab)
+
+    @property
+    def deductions(self) -> Dict[str, float]:
+        return self._table.deductions.row_dict(self._i, self._table.vocab)
+
+    def total_allowances(self) -> float:
+        return self._table.allowances.row_total(self._i)
+
+    def total_deductions(self) -> float:
+        return self._table.deductions.row_total(self._i)
+
+    def to_employee(self) -> Employee:
+        return Employee(emp_id=self.emp_id, name=self.name, base_salary=self.base_salary,
+                        allowances=self.allowances, deductions=self.deductions)
+
+    def __reduce__(self):
+        # pickle (e.g. into bulk's worker processes) as a plain Employee,
+        # not as a reference that drags the whole table along
+        return (Employee, (self.emp_id, self.name, self.base_salary,
+                           self.allowances, self.deductions))
+
+    def __repr__(self) -> str:
+        return f"EmployeeRow({self.emp_id!r}, {self.name!r})"
+
+class EmployeeTable:
+    def __init__(self):
+        self.vocab = ComponentVocab()
+        self.emp_ids: List[str] = []
+        self.names: List[str] = []
+        self.base_salary = array("d")
+        self.allowances = _SparseColumn()
+        self.deductions = _SparseColumn()
+
+    @classmethod
+    def from_employees(cls, employees: Iterable[Employee]) -> "EmployeeTable":
+        table = cls()
+        for e in employees:
+            table.add(e)
+        return table
+
+    def append(self, emp_id: str, name: str, base_salary: float,
+               allowances: Optional[Dict[str, float]] = None,
+               deductions: Optional[Dict[str, float]] = None) -> int:
+        """Add one employee; returns its row index."""
+        self.emp_ids.append(emp_id)
+        self.names.append(name)
+        self.base_salary.append(base_salary)
+        self.allowances.append(allowances, self.vocab)
+        self.deductions.append(deductions, self.vocab)
+        return len(self.emp_ids) - 1
+
+    def add(self, employee: Employee) -> int:
+        return self.append(employee.emp_id, employee.name, employee.base_salary,
+                           employee.allowances, employee.deductions)
+
+    def __len__(self) -> int:
+        return len(self.emp_ids)
+
+    def __getitem__(self, i: int) -> EmployeeRow:
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("employee row out of range")
+        return EmployeeRow(self, i)
+
+    def __iter__(self) -> Iterator[EmployeeRow]:
+        for i in range(len(self)):
+            yield EmployeeRow(self, i)
+
+    def total_allowances(self):
+        """Allowance total per employee, as one column reduction."""
+        return self.allowances.totals()
+
+    def total_deductions(self):
+        """Deduction total per employee, as one column reduction."""
+        return self.deductions.totals()
+
+    def columns(self):
+        """(base_salary, allowances, deductions) columns for batch.breakdown_batch()."""
+        base = np.array(self.base_salary, dtype=np.float64) if np is not None else list(self.base_salary)
+        return base, self.total_allowances(), self.total_deductions()
@@ -6,25 +6,122 @@ Simple progressive tax example:
 - 10% for next 50000
 - 15% above that
 
-This is illustrative — replace with your real rules.
+This is illustrative — replace with your real rules, either by editing
+BRACKETS or by loading a schedule from a JSON file (see TaxSchedule.from_file).
 """
 
-def compute_tax(income: float) -> float:
-    tax = 0.0
-    remain = income
-
-    brackets = [
-        (25000, 0.00),
-        (25000, 0.05),
-        (50000, 0.10),
-        (float("inf"), 0.15),
-    ]
-
-    for limit, rate in brackets:
-        take = min(remain, limit)
-        tax += take * rate
-        remain -= take
-        if remain <= 0:
-            break
-
-    return round(tax, 2)
+import hashlib
+import json
+from bisect import bisect_right
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from money import (RATE_SCALE, div_round, div_round_array, from_paise, from_paise_array,
+                   rate_units, to_paise, to_paise_array)
+
+# (slab width, rate) pairs, applied in order
+BRACKETS = [
+    (25000, 0.00),
+    (25000, 0.05),
+    (50000, 0.10),
+    (float("inf"), 0.15),
+]
+
+class TaxSchedule:
+    """
+    A bracket table compiled once: slab lower bounds plus the cumulative
+    tax owed at each bound, so any income costs one bisect and one multiply.
+
+    Everything is integer paise; the cumulative tax is kept in
+    paise * RATE_SCALE units so it is exact, and rounding to the paisa
+    (half-up) happens once per income.
+    """
+
+    def __init__(self, brackets: Sequence[Tuple[float, float]]):
+        if not brackets:
+            raise ValueError("tax schedule needs at least one bracket")
+        self.brackets: List[Tuple[float, float]] = [(float(w), float(r)) for w, r in brackets]
+        self.lowers: List[int] = []       # slab lower bounds, paise
+        self.units: List[int] = []        # rates in 1/RATE_SCALE units
+        self.base_scaled: List[int] = []  # tax owed below each bound, paise * RATE_SCALE
+
+        lower, acc = 0, 0
+        for i, (width, rate) in enumerate(self.brackets):
+            if width <= 0:
+                raise ValueError(f"bracket width must be positive, got {width}")
+            if width == float("inf") and i != len(self.brackets) - 1:
+                raise ValueError("only the last bracket may be unbounded")
+            self.lowers.append(lower)
+            self.units.append(rate_units(rate))
+            self.base_scaled.append(acc)
+            if width != float("inf"):
+                acc += to_paise(width) * self.units[-1]
+                lower += to_paise(width)
+        self._arrays = None
+
+    @property
+    def rates(self) -> List[float]:
+        return [u / RATE_SCALE for u in self.units]
+
+    @classmethod
+    def from_file(cls, path) -> "TaxSchedule":
+        """
+        Load a schedule from JSON:
+            {"brackets": [[25000, 0.0], [25000, 0.05], [null, 0.15]]}
+        A null width means "no upper limit".
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        try:
+            rows = data["brackets"] if isinstance(data, dict) else data
+            brackets = [(float("inf") if w is None else w, r) for w, r in rows]
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"{path}: expected a list of [width, rate] brackets") from None
+        return cls(brackets)
+
+    def compute_paise(self, income: int) -> int:
+        """Tax in paise on an income in paise."""
+        i = bisect_right(self.lowers, income) - 1
+        if i < 0:
+            i = 0
+        return div_round(self.base_scaled[i] + (income - self.lowers[i]) * self.units[i], RATE_SCALE)
+
+    def compute(self, income: float) -> float:
+        return from_paise(self.compute_paise(to_paise(income)))
+
+    def arrays(self):
+        """(lowers, units, base_scaled) as int64 numpy arrays, built once."""
+        if self._arrays is None:
+            import numpy as np
+            self._arrays = (np.asarray(self.lowers, dtype=np.int64),
+                            np.asarray(self.units, dtype=np.int64),
+                            np.asarray(self.base_scaled, dtype=np.int64))
+        return self._arrays
+
+    def compute_many_paise(self, incomes):
+        """Vectorized compute_paise() over an int64 paise array."""
+        import numpy as np
+
+        lowers, units, base_scaled = self.arrays()
+        incomes = np.asarray(incomes, dtype=np.int64)
+        idx = np.searchsorted(lowers, incomes, side="right") - 1
+        np.maximum(idx, 0, out=idx)
+        return div_round_array(base_scaled[idx] + (incomes - lowers[idx]) * units[idx], RATE_SCALE)
+
+    def compute_many(self, incomes):
+        """Vectorized compute() over a numpy array (or anything array-like) of rupees."""
+        return from_paise_array(self.compute_many_paise(to_paise_array(incomes)))
+
+    def digest(self) -> str:
+        """Stable fingerprint of the bracket table (used to detect rule changes)."""
+        return hashlib.blake2b(repr(self.brackets).encode("utf-8"), digest_size=16).hexdigest()
+
+    def __repr__(self) -> str:
+        return f"TaxSchedule({self.brackets!r})"
+
+@lru_cache(maxsize=1)
+def default_schedule() -> TaxSchedule:
+    return TaxSchedule(BRACKETS)
+
+def compute_tax(income: float, schedule: Optional[TaxSchedule] = None) -> float:
+    return (schedule or default_schedule()).compute(income)
@@ -0,0 +1,88 @@
+# payroll/template.py
+"""
+Compiled payslip layout.
+
+The fixed parts of a slip (company header, separators, labels) are built
+once per template; rendering an employee only fills in names and amounts.
+Repeated amounts and allowance/deduction labels are memoised.
+"""
+
+import hashlib
+from typing import Dict, Optional
+
+from .employee import Employee
+from .helpers import fmt_currency, now_str
+
+CACHE_LIMIT = 65536
+_currency_cache: Dict[float, str] = {}
+_label_cache: Dict[str, str] = {}
+
+def fmt_currency_cached(amount: float) -> str:
+    """fmt_currency() behind a bounded memo (cleared when it fills up)."""
+    s = _currency_cache.get(amount)
+    if s is None:
+        if len(_currency_cache) >= CACHE_LIMIT:
+            _currency_cache.clear()
+        s = _currency_cache[amount] = fmt_currency(amount)
+    return s
+
+def item_label(name: str) -> str:
+    """'\n  HRA          : ' — padded line prefix for an allowance/deduction."""
+    s = _label_cache.get(name)
+    if s is None:
+        if len(_label_cache) >= CACHE_LIMIT:
+            _label_cache.clear()
+        s = _label_cache[name] = f"\n  {name:12} : "
+    return s
+
+class PayslipTemplate:
+    def __init__(self, company: str = "Company XYZ Pvt Ltd", width: int = 30):
+        sep = "-" * width
+        self.company = company
+        self.header = f"=== {company} ==="
+        self.sep = sep
+        self.allowances_head = f"\n{sep}\nBase Salary : "
+        self.gross_head = "\nGross Salary: "
+        self.deductions_head = f"\n{sep}\nDeductions:"
+        self.tax_head = "\nTax         : "
+        self.total_head = "\nTotal Deduct: "
+        self.net_head = f"\n{sep}\nNet Pay     : "
+        self.footer = f"\n{sep}"
+
+    def digest(self) -> str:
+        """Stable fingerprint of the fixed text in render_body() (company and separators too)."""
+        parts = (self.company, self.sep, self.allowances_head, self.gross_head, self.deductions_head,
+                 self.tax_head, self.total_head, self.net_head, self.footer)
+        return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+    def render_header(self, employee: Employee, month: str, year: int,
+                      generated: Optional[str] = None) -> str:
+        """Company, employee and period lines — everything that changes per run."""
+        return (f"{self.header}\nPayslip for: {employee.name} (ID: {employee.emp_id})"
+                f"\nPeriod: {month} {year}\nGenerated: {generated or now_str()}")
+
+    def render_body(self, employee: Employee, bd: Dict[str, float]) -> str:
+        """Amount lines; depends only on the employee's pay data and breakdown."""
+        fmt = fmt_currency_cached
+        parts = [self.allowances_head, fmt(employee.base_salary), "\nAllowances:"]
+        if employee.allowances:
+            for k, v in employee.allowances.items():
+                parts += (item_label(k), fmt(v))
+        else:
+            parts.append("\n  (none)")
+        parts += (self.gross_head, fmt(bd["gross"]), self.deductions_head)
+        if employee.deductions:
+            for k, v in employee.deductions.items():
+                parts += (item_label(k), fmt(v))
+        else:
+            parts.append("\n  (none)")
+        parts += (self.tax_head, fmt(bd["tax"]), self.total_head, fmt(bd["deductions"]),
+                  self.net_head, fmt(bd["net"]), self.footer)
+        return "".join(parts)
+
+    def render(self, employee: Employee, bd: Dict[str, float], month: str, year: int,
+               generated: Optional[str] = None) -> str:
+        """Render a slip from an employee and its salary.breakdown() result."""
+        return self.render_header(employee, month, year, generated) + self.render_body(employee, bd)
+
+DEFAULT_TEMPLATE = PayslipTemplate()
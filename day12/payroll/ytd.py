@@ -0,0 +1,163 @@
+# payroll/ytd.py
+"""
+Year-to-date ledger: running gross/tax/net per employee, updated as each
+month's breakdown() is posted, plus an annual tax projection.
+
+On disk it is a small header followed by fixed-width records, one per
+employee, updated in place:
+
+    emp_id (32 bytes, utf-8, NUL padded) | fiscal year | months posted |
+    last period (yyyymm) | gross | tax | net        (amounts in paise)
+
+The emp_id -> slot index is rebuilt on open; after that get(), post() and
+project() are O(1) whatever the number of months posted.
+"""
+
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from money import from_paise, to_paise
+from .tax import TaxSchedule, default_schedule
+
+MAGIC = b"YTD1"
+HEADER = struct.Struct("<4sB3x")
+RECORD = struct.Struct("<32siiiqqq")
+
+MONTHS = ["January", "February", "March", "April", "May", "June", "July",
+          "August", "September", "October", "November", "December"]
+
+def month_number(month: Union[int, str]) -> int:
+    """1-12 from an int or a month name ("March", "mar")."""
+    if isinstance(month, int) or str(month).isdigit():
+        n = int(month)
+    else:
+        key = str(month).strip()[:3].lower()
+        n = next((i + 1 for i, m in enumerate(MONTHS) if m[:3].lower() == key), 0)
+    if not 1 <= n <= 12:
+        raise ValueError(f"bad month: {month!r}")
+    return n
+
+def annual_schedule(schedule: Optional[TaxSchedule] = None) -> TaxSchedule:
+    """Annual equivalent of a monthly schedule (every slab width x 12)."""
+    schedule = schedule or default_schedule()
+    return TaxSchedule([(w * 12, r) for w, r in schedule.brackets])
+
+class YTDLedger:
+    def __init__(self, path: str = "payroll_ytd.bin", fy_start_month: int = 4):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.slots: Dict[str, int] = {}
+        self._annual: Optional[TaxSchedule] = None
+
+        if self.path.exists() and self.path.stat().st_size >= HEADER.size:
+            self.f = open(self.path, "r+b")
+            magic, self.fy_start_month = HEADER.unpack(self.f.read(HEADER.size))
+            if magic != MAGIC:
+                raise ValueError(f"{path} is not a YTD ledger")
+            data = self.f.read()
+            for slot in range(len(data) // RECORD.size):
+                raw_id = RECORD.unpack_from(data, slot * RECORD.size)[0]
+                self.slots[raw_id.rstrip(b"\0").decode("utf-8")] = slot
+        else:
+            self.fy_start_month = month_number(fy_start_month)
+            self.f = open(self.path, "w+b")
+            self.f.write(HEADER.pack(MAGIC, self.fy_start_month))
+            self.f.flush()
+
+    def __enter__(self) -> "YTDLedger":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.f.close()
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def fiscal_year(self, month: Union[int, str], year: int) -> int:
+        """Fiscal year a period belongs to, named by the year it starts in."""
+        return year if month_number(month) >= self.fy_start_month else year - 1
+
+    def months_into_year(self, month: Union[int, str]) -> int:
+        """1 for the first month of the fiscal year ... 12 for the last."""
+        return (month_number(month) - self.fy_start_month) % 12 + 1
+
+    def _read(self, slot: int) -> Tuple:
+        self.f.seek(HEADER.size + slot * RECORD.size)
+        return RECORD.unpack(self.f.read(RECORD.size))
+
+    def _write(self, slot: int, rec: Tuple) -> None:
+        self.f.seek(HEADER.size + slot * RECORD.size)
+        self.f.write(RECORD.pack(*rec))
+
+    def post(self, emp_id: str, month: Union[int, str], year: int, bd: Dict[str, float]) -> None:
+        """
+        Add one month's breakdown() to the employee's running totals.
+        Totals reset at the start of each fiscal year; posting a period that
+        is not after the last one posted raises ValueError.
+        """
+        raw_id = emp_id.encode("utf-8")
+        if len(raw_id) > 32:
+            raise ValueError(f"emp_id too long for YTD ledger: {emp_id!r}")
+        period = year * 100 + month_number(month)
+        fy = self.fiscal_year(month, year)
+
+        slot = self.slots.get(emp_id)
+        if slot is None:
+            slot = self.slots[emp_id] = len(self.slots)
+            rec_fy, months, gross, tax, net = fy, 0, 0, 0, 0
+        else:
+            _, rec_fy, months, last, gross, tax, net = self._read(slot)
+            if period <= last:
+                raise ValueError(f"{emp_id}: period {period} already posted (last {last})")
+            if rec_fy != fy:
+                rec_fy, months, gross, tax, net = fy, 0, 0, 0, 0
+
+        self._write(slot, (raw_id, rec_fy, months + 1, period,
+                           gross + to_paise(bd["gross"]), tax + to_paise(bd["tax"]),
+                           net + to_paise(bd["net"])))
+
+    def post_many(self, month: Union[int, str], year: int,
+                  items: Iterable[Tuple[str, Dict[str, float]]]) -> int:
+        """Post (emp_id, breakdown) pairs for one period; returns how many."""
+        count = 0
+        for emp_id, bd in items:
+            self.post(emp_id, month, year, bd)
+            count += 1
+        self.f.flush()
+        return count
+
+    def get(self, emp_id: str) -> Optional[Dict[str, float]]:
+        slot = self.slots.get(emp_id)
+        if slot is None:
+            return None
+        _, fy, months, last, gross, tax, net = self._read(slot)
+        return {"fiscal_year": fy, "months": months, "last_period": last,
+                "gross": from_paise(gross), "tax": from_paise(tax), "net": from_paise(net)}
+
+    def project(self, emp_id: str, schedule: Optional[TaxSchedule] = None) -> Optional[Dict[str, float]]:
+        """
+        Project the year: remaining months are assumed to pay the average
+        gross so far.  `schedule` is the annual schedule (default: the
+        monthly default with slabs scaled x12).
+        """
+        ytd = self.get(emp_id)
+        if ytd is None:
+            return None
+        elapsed = self.months_into_year(ytd["last_period"] % 100)
+        remaining = 12 - elapsed
+        avg_gross = ytd["gross"] / ytd["months"]
+        annual_gross = round(ytd["gross"] + avg_gross * remaining, 2)
+        if schedule is None:
+            if self._annual is None:
+                self._annual = annual_schedule()
+            schedule = self._annual
+        annual_tax = schedule.compute(annual_gross)
+        return {"ytd_gross": ytd["gross"], "ytd_tax": ytd["tax"],
+                "months_remaining": remaining,
+                "projected_annual_gross": annual_gross,
+                "projected_annual_tax": annual_tax,
+                "tax_remaining": round(annual_tax - ytd["tax"], 2)}
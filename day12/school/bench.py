@@ -0,0 +1,64 @@
+"""
+In-memory vs SQLite school storage: bulk load and lookups.
+Usage (from day12/): python -m school.bench [N]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from .registry import StudentRegistry
+from .storage import SQLiteBackend
+
+def roster(n, seed=7):
+    rng = random.Random(seed)
+    first = ["Asha", "Arun", "Bala", "Divya", "Kiran", "Meena", "Ravi", "Sita", "Vijay", "Zara"]
+    for i in range(n):
+        yield f"{rng.choice(first)} {i:07d}", f"R{i:07d}", str(rng.randint(1, 12))
+
+def time_backend(students, rows, lookups=10_000):
+    n = len(rows)
+    result = {}
+    t0 = time.perf_counter()
+    students.add_many(rows)
+    result["bulk_load_s"] = time.perf_counter() - t0
+
+    rng = random.Random(1)
+    rolls = [f"R{rng.randrange(n):07d}" for _ in range(lookups)]
+    t0 = time.perf_counter()
+    for r in rolls:
+        students.get_by_roll(r)
+    result["get_by_roll_us"] = (time.perf_counter() - t0) / lookups * 1e6
+
+    t0 = time.perf_counter()
+    result["grade_7"] = students.count_grade("7")
+    result["count_grade_ms"] = (time.perf_counter() - t0) * 1e3
+
+    t0 = time.perf_counter()
+    result["prefix_hits"] = len(students.search_name_prefix("Meena 00001", limit=100))
+    result["name_prefix_ms"] = (time.perf_counter() - t0) * 1e3
+
+    t0 = time.perf_counter()
+    students.rows[n // 2:n // 2 + 50]
+    result["page_ms"] = (time.perf_counter() - t0) * 1e3
+    return result
+
+def run(n=1_000_000):
+    rows = list(roster(n))
+    results = {"memory": time_backend(StudentRegistry(), rows)}
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = SQLiteBackend(os.path.join(tmp, "school.db"))
+        try:
+            results["sqlite"] = time_backend(backend.students, rows)
+        finally:
+            backend.close()
+    return results
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    for backend, result in run(n).items():
+        print(f"[{backend}]")
+        for k, v in result.items():
+            print(f"  {k:16}: {v:.3f}" if isinstance(v, float) else f"  {k:16}: {v}")
@@ -0,0 +1,49 @@
+import sys
+
+DEFAULT_PAGE_SIZE = 50
+BATCH_SIZE = 2000
+
+
+def page_window(total, page=None, page_size=None, cursor=None):
+    """
+    (start, stop) row range for a listing.  `cursor` (a row offset returned
+    by a previous listing) wins over `page`, which counts from 1.  With none
+    of the three set, the whole listing is one window.
+    """
+    if cursor is None and page is None and page_size is None:
+        return 0, total
+    size = page_size or DEFAULT_PAGE_SIZE
+    if size < 1:
+        raise ValueError("page size must be at least 1")
+    if cursor is not None:
+        start = int(cursor)
+    else:
+        start = (max(page or 1, 1) - 1) * size
+    start = min(max(start, 0), total)
+    return start, min(start + size, total)
+
+
+def render(rows, fmt, title, empty, page=None, page_size=None, cursor=None, out=None):
+    """
+    Write one window of `rows` (a list) to `out` (default stdout), each row
+    formatted with `fmt.format_map(row)`.  Rows are joined in batches and
+    written with one call per batch instead of one print() per row.
+
+    Returns the cursor for the next window, or None when nothing is left.
+    """
+    out = out or sys.stdout
+    start, stop = page_window(len(rows), page, page_size, cursor)
+    if start >= stop:
+        out.write(empty + "\n")
+        return None
+    out.write(f"\n--- {title} ---\n")
+    for lo in range(start, stop, BATCH_SIZE):
+        chunk = rows[lo:min(lo + BATCH_SIZE, stop)]
+        out.write("\n".join(map(fmt.format_map, chunk)) + "\n")
+    out.write("--------------------\n\n")
+    return stop if stop < len(rows) else None
+
+
+def open_output(path):
+    """A large-buffered text file for streaming a listing to disk or a pipe."""
+    return open(path, "w", encoding="utf-8", buffering=1 << 20)
@@ -1,8 +1,65 @@
-from .students import add_student, list_students
-from .teachers import add_teacher, list_teachers
+import argparse
+import os
+import sys
+
+from .students import add_student, import_students, list_students, find_student, list_students_by_grade, search_students
+from .teachers import add_teacher, list_teachers, list_teachers_for_subject
 from .subjects import add_subject, list_subjects
+from .listing import DEFAULT_PAGE_SIZE, open_output
+from .registry import registry
+from .storage import SQLiteBackend
+
+LISTS = {"students": list_students, "teachers": list_teachers, "subjects": list_subjects}
+
+def parse_args(argv=None):
+    p = argparse.ArgumentParser(description="School Management System")
+    p.add_argument("--db", default=os.environ.get("SCHOOL_DB"),
+                   help="SQLite database to keep records in (default: $SCHOOL_DB, else memory only)")
+    sub = p.add_subparsers(dest="command")
+    ip = sub.add_parser("import", help="Bulk-load a CSV roster (name,roll_no,grade) and exit")
+    ip.add_argument("path")
+    lp = sub.add_parser("list", help="Print a listing and exit")
+    lp.add_argument("what", choices=sorted(LISTS))
+    lp.add_argument("--page", type=int, help="Page number, from 1")
+    lp.add_argument("--page-size", type=int, help=f"Rows per page (default {DEFAULT_PAGE_SIZE} when paging)")
+    lp.add_argument("--cursor", type=int, help="Continue from a cursor printed by a previous page")
+    lp.add_argument("-o", "--output", help="Write the listing to this file instead of stdout")
+    return p.parse_args(argv)
+
+def run_list(args):
+    out = open_output(args.output) if args.output else sys.stdout
+    try:
+        cursor = LISTS[args.what](page=args.page, page_size=args.page_size,
+                                  cursor=args.cursor, out=out)
+    finally:
+        if args.output:
+            out.close()
+    if cursor is not None:
+        print(f"More rows available; continue with --cursor {cursor}", file=sys.stderr)
+
+def page_through(list_fn):
+    """Interactive listing: one page at a time, continuing from the cursor."""
+    cursor = list_fn(page_size=DEFAULT_PAGE_SIZE)
+    while cursor is not None:
+        if input("Enter for more, q to stop: ").strip().lower() == "q":
+            break
+        cursor = list_fn(cursor=cursor, page_size=DEFAULT_PAGE_SIZE)
 
-def main():
+def main(argv=None):
+    args = parse_args(argv)
+    if args.db:
+        registry.attach(SQLiteBackend(args.db))
+    try:
+        if args.command == "list":
+            run_list(args)
+        elif args.command == "import":
+            import_students(args.path)
+        else:
+            menu()
+    finally:
+        registry.close()
+
+def menu():
     while True:
         print("\n=== School Management System ===")
         print("1. Add Student")
@@ -11,7 +68,11 @@ def main():
         print("4. View Teachers")
         print("5. Add Subject")
         print("6. View Subjects")
-        print("7. Exit")
+        print("7. Find Student by Roll No")
+        print("8. View Students by Grade")
+        print("9. Search Students by Name")
+        print("10. Teachers for Subject Code")
+        print("11. Exit")
 
         choice = input("Enter your choice: ")
 
@@ -22,15 +83,16 @@ def main():
             add_student(name, roll_no, grade)
 
         elif choice == "2":
-            list_students()
+            page_through(list_students)
 
         elif choice == "3":
             name = input("Enter teacher name: ")
             subject = input("Enter subject: ")
-            add_teacher(name, subject)
+            grades = input("Enter grades taught (comma separated, optional): ")
+            add_teacher(name, subject, [g.strip() for g in grades.split(",") if g.strip()])
 
         elif choice == "4":
-            list_teachers()
+            page_through(list_teachers)
 
         elif choice == "5":
             name = input("Enter subject name: ")
@@ -38,9 +100,21 @@ def main():
             add_subject(name, code)
 
         elif choice == "6":
-            list_subjects()
+            page_through(list_subjects)
 
         elif choice == "7":
+            find_student(input("Enter roll number: "))
+
+        elif choice == "8":
+            list_students_by_grade(input("Enter grade: "))
+
+        elif choice == "9":
+            search_students(input("Enter name prefix: "))
+
+        elif choice == "10":
+            list_teachers_for_subject(input("Enter subject code: "))
+
+        elif choice == "11":
             print("Exiting School Management System. Goodbye!")
             break
 
@@ -0,0 +1,230 @@
+import heapq
+from bisect import bisect_left
+
+# new names are scanned linearly until there are this many, then merged
+PENDING_NAMES_MAX = 1024
+
+
+class StudentRegistry:
+    """
+    Students with indexes on roll number (unique), grade and name prefix.
+
+    The name index is a sorted list of (lowercased name, roll_no).  New
+    names go to a small unsorted buffer, so inserts stay O(1): a prefix
+    search bisects the sorted list and scans the buffer, and once the buffer
+    passes PENDING_NAMES_MAX it is sorted and merged in.
+    """
+
+    def __init__(self):
+        self.rows = []
+        self.by_roll = {}
+        self.by_grade_index = {}
+        self._names = []
+        self._pending_names = []
+
+    def add(self, name, roll_no, grade):
+        if roll_no in self.by_roll:
+            raise ValueError(f"Roll No {roll_no} already exists")
+        student = {"name": name, "roll_no": roll_no, "grade": grade}
+        self.rows.append(student)
+        self.by_roll[roll_no] = student
+        self.by_grade_index.setdefault(grade, []).append(student)
+        self._pending_names.append((name.lower(), roll_no))
+        return student
+
+    def add_many(self, rows):
+        """Add (name, roll_no, grade) rows; all or nothing if a roll number repeats."""
+        rows = list(rows)
+        seen = set()
+        for _, roll_no, _ in rows:
+            if roll_no in self.by_roll or roll_no in seen:
+                raise ValueError(f"Roll No {roll_no} already exists; nothing was imported")
+            seen.add(roll_no)
+        for name, roll_no, grade in rows:
+            self.add(name, roll_no, grade)
+        return len(rows)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def get_by_roll(self, roll_no):
+        return self.by_roll.get(roll_no)
+
+    def by_grade(self, grade):
+        return list(self.by_grade_index.get(grade, ()))
+
+    def count_grade(self, grade):
+        return len(self.by_grade_index.get(grade, ()))
+
+    def search_name_prefix(self, prefix, limit=None):
+        if len(self._pending_names) > PENDING_NAMES_MAX:
+            self._pending_names.sort()
+            if self._names:
+                # two sorted runs: timsort merges them in one linear pass
+                self._names.extend(self._pending_names)
+                self._names.sort()
+            else:
+                self._names = self._pending_names
+            self._pending_names = []
+        prefix = prefix.lower()
+        keys = []
+        i = bisect_left(self._names, (prefix,))
+        while i < len(self._names) and self._names[i][0].startswith(prefix):
+            if limit is not None and len(keys) >= limit:
+                break
+            keys.append(self._names[i])
+            i += 1
+        new = sorted(key for key in self._pending_names if key[0].startswith(prefix))
+        if new:
+            keys = list(heapq.merge(keys, new))[:limit]
+        return [self.by_roll[roll_no] for _, roll_no in keys]
+
+
+class MemoryBackend:
+    """The default backend: everything lives in this process and is lost on exit."""
+
+    def __init__(self):
+        self.students = StudentRegistry()
+
+    def load_subjects(self):
+        return []
+
+    def load_teachers(self):
+        return []
+
+    def save_subject(self, subject):
+        pass
+
+    def save_teacher(self, teacher):
+        pass
+
+    def close(self):
+        pass
+
+
+class SchoolRegistry:
+    """
+    Students, teachers and subjects with join indexes kept current on every add.
+
+    Teachers and subjects get integer ids (their position in `teachers` /
+    `subjects`); students are keyed by roll_no.  A teacher's free-text
+    subject is matched against subject codes and names (case-insensitive);
+    if the subject isn't registered yet the link is made when it is.
+    Every cross-entity lookup costs O(result size).
+
+    Storage is pluggable (see attach()): students live in the backend and
+    are queried there; teachers and subjects are also saved to it and
+    reloaded into these indexes when it is attached.
+    """
+
+    def __init__(self, backend=None):
+        self.teachers = []
+        self.subjects = []
+        self.backend = None
+        self.attach(backend)
+
+    def attach(self, backend=None):
+        """Switch to `backend` (default: a fresh MemoryBackend), closing the old one."""
+        if self.backend is not None:
+            self.backend.close()
+        self.backend = backend or MemoryBackend()
+        self.students = self.backend.students
+        # cleared in place: school.teachers / school.subjects hold these lists
+        self.teachers.clear()
+        self.subjects.clear()
+        self.subject_codes = set()     # lowercased codes, for uniqueness
+        self.subject_ids = {}          # lowercased code or name -> subject id
+        self.subject_teachers = {}     # subject id -> [teacher id]
+        self.teacher_subjects = {}     # teacher id -> [subject id]
+        self.grade_teachers = {}       # grade -> [teacher id]
+        self._unlinked = {}            # subject text -> [teacher id] awaiting that subject
+        for s in self.backend.load_subjects():
+            self._add_subject(s["name"], s["code"])
+        for t in self.backend.load_teachers():
+            self._add_teacher(t["name"], t["subject"], t["grades"])
+
+    def close(self):
+        self.attach(None)
+
+    def add_student(self, name, roll_no, grade):
+        return self.students.add(name, roll_no, grade)
+
+    def add_students(self, rows):
+        """Bulk-add (name, roll_no, grade) rows; returns how many were added."""
+        return self.students.add_many(rows)
+
+    def add_subject(self, name, code):
+        subject = self._add_subject(name, code)
+        self.backend.save_subject(subject)
+        return subject
+
+    def add_teacher(self, name, subject, grades=()):
+        teacher = self._add_teacher(name, subject, grades)
+        self.backend.save_teacher(teacher)
+        return teacher
+
+    def _add_subject(self, name, code):
+        if code.strip().lower() in self.subject_codes:
+            raise ValueError(f"Subject code {code} already exists")
+        self.subject_codes.add(code.strip().lower())
+        subject = {"id": len(self.subjects), "name": name, "code": code}
+        self.subjects.append(subject)
+        self.subject_teachers[subject["id"]] = []
+        # codes win over names when the two collide
+        self.subject_ids[code.strip().lower()] = subject["id"]
+        for key in {code.strip().lower(), name.strip().lower()}:
+            self.subject_ids.setdefault(key, subject["id"])
+            for tid in self._unlinked.pop(key, ()):
+                self._link(tid, subject["id"])
+        return subject
+
+    def _add_teacher(self, name, subject, grades=()):
+        teacher = {"id": len(self.teachers), "name": name, "subject": subject,
+                   "grades": list(grades)}
+        self.teachers.append(teacher)
+        self.teacher_subjects[teacher["id"]] = []
+        key = subject.strip().lower()
+        sid = self.subject_ids.get(key)
+        if sid is None:
+            self._unlinked.setdefault(key, []).append(teacher["id"])
+        else:
+            self._link(teacher["id"], sid)
+        for grade in teacher["grades"]:
+            self.grade_teachers.setdefault(grade, []).append(teacher["id"])
+        return teacher
+
+    def _link(self, teacher_id, subject_id):
+        if subject_id not in self.teacher_subjects[teacher_id]:
+            self.teacher_subjects[teacher_id].append(subject_id)
+            self.subject_teachers[subject_id].append(teacher_id)
+
+    # --- joins ---------------------------------------------------------
+
+    def subject_by_code(self, code):
+        sid = self.subject_ids.get(code.strip().lower())
+        return None if sid is None else self.subjects[sid]
+
+    def teachers_for_subject(self, code):
+        sid = self.subject_ids.get(code.strip().lower())
+        if sid is None:
+            return []
+        return [self.teachers[t] for t in self.subject_teachers[sid]]
+
+    def subjects_for_teacher(self, teacher_id):
+        return [self.subjects[s] for s in self.teacher_subjects.get(teacher_id, ())]
+
+    def teachers_for_grade(self, grade):
+        return [self.teachers[t] for t in self.grade_teachers.get(grade, ())]
+
+    def students_for_teacher(self, teacher_id):
+        students = []
+        for grade in self.teachers[teacher_id]["grades"]:
+            students.extend(self.students.by_grade(grade))
+        return students
+
+    def student_load(self, teacher_id):
+        """Number of students in the grades a teacher takes, without listing them."""
+        return sum(self.students.count_grade(g) for g in self.teachers[teacher_id]["grades"])
+
+
+registry = SchoolRegistry()
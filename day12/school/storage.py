@@ -0,0 +1,197 @@
+import sqlite3
+from pathlib import Path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL,
+    roll_no TEXT NOT NULL UNIQUE,
+    grade TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS subjects (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    code TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS teachers (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    grades TEXT NOT NULL
+);
+"""
+
+# covering indexes: each student lookup reads only its index, never the table
+STUDENT_INDEXES = {
+    "students_roll": ("roll_no", "name", "grade"),
+    "students_grade": ("grade", "id", "roll_no", "name"),   # id: insertion order
+    "students_name": ("name_key", "roll_no", "name", "grade"),
+}
+
+# a bulk load drops the secondary indexes and rebuilds them afterwards
+# (one sort per index instead of a b-tree insert per row) when it brings
+# at least as many rows as the table already has, and at least this many
+REINDEX_MIN_ROWS = 50_000
+
+INSERT_STUDENT = "INSERT INTO students (name, name_key, roll_no, grade) VALUES (?, ?, ?, ?)"
+
+
+class SQLiteBackend:
+    """
+    School data in a SQLite file (WAL journal).  Students are queried in
+    the database through covering indexes on roll number, grade and name:
+    each index holds every column those lookups return, so they are
+    answered from the index alone (EXPLAIN QUERY PLAN says COVERING INDEX).
+    roll_no is also unique.  Teachers and subjects are small and are
+    reloaded into memory by SchoolRegistry.attach().
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # up to 128 MB of page cache (allocated on demand) keeps big loads off the disk
+        self.conn.execute("PRAGMA cache_size=-131072")
+        self.conn.executescript(SCHEMA)
+        with self.conn:
+            for name, columns in STUDENT_INDEXES.items():
+                # files from older versions may have the index with fewer columns
+                have = tuple(row[2] for row in self.conn.execute(f"PRAGMA index_info({name})"))
+                if have != columns:
+                    self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+                    self.conn.execute(_create_index(name, columns))
+        self.students = SQLiteStudents(self.conn)
+
+    def load_subjects(self):
+        cur = self.conn.execute("SELECT name, code FROM subjects ORDER BY id")
+        return [{"name": name, "code": code} for name, code in cur]
+
+    def load_teachers(self):
+        cur = self.conn.execute("SELECT name, subject, grades FROM teachers ORDER BY id")
+        return [{"name": name, "subject": subject, "grades": grades.split(",") if grades else []}
+                for name, subject, grades in cur]
+
+    def save_subject(self, subject):
+        with self.conn:
+            self.conn.execute("INSERT INTO subjects (id, name, code) VALUES (?, ?, ?)",
+                              (subject["id"] + 1, subject["name"], subject["code"]))
+
+    def save_teacher(self, teacher):
+        with self.conn:
+            self.conn.execute("INSERT INTO teachers (id, name, subject, grades) VALUES (?, ?, ?, ?)",
+                              (teacher["id"] + 1, teacher["name"], teacher["subject"],
+                               ",".join(map(str, teacher["grades"]))))
+
+    def close(self):
+        self.conn.close()
+
+
+class SQLiteStudents:
+    """Same interface as StudentRegistry, answered by SQL queries."""
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.rows = StudentRows(conn)
+
+    def add(self, name, roll_no, grade):
+        try:
+            with self.conn:
+                self.conn.execute(INSERT_STUDENT, (name, name.lower(), str(roll_no), str(grade)))
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Roll No {roll_no} already exists") from None
+        return {"name": name, "roll_no": str(roll_no), "grade": str(grade)}
+
+    def add_many(self, rows):
+        """
+        One transaction, one prepared statement; all or nothing on a
+        repeated roll number.  Roll-number uniqueness is checked per row
+        throughout; for loads at least as big as the table (see
+        REINDEX_MIN_ROWS) the lookup indexes are rebuilt at the end.
+        """
+        if not isinstance(rows, (list, tuple)):
+            rows = list(rows)
+        reindex = len(rows) >= max(REINDEX_MIN_ROWS, len(self.rows))
+        count = 0
+
+        def params():
+            nonlocal count
+            for name, roll_no, grade in rows:
+                count += 1
+                yield name, name.lower(), str(roll_no), str(grade)
+
+        try:
+            with self.conn:
+                # explicit BEGIN so the index drops roll back with the rows
+                self.conn.execute("BEGIN")
+                if reindex:
+                    for name in STUDENT_INDEXES:
+                        self.conn.execute(f"DROP INDEX IF EXISTS {name}")
+                self.conn.executemany(INSERT_STUDENT, params())
+                if reindex:
+                    for name, columns in STUDENT_INDEXES.items():
+                        self.conn.execute(_create_index(name, columns))
+        except sqlite3.IntegrityError:
+            raise ValueError("repeated roll number; nothing was imported") from None
+        return count
+
+    def __len__(self):
+        return len(self.rows)
+
+    def get_by_roll(self, roll_no):
+        # the planner would pick the (non-covering) UNIQUE autoindex on its own
+        row = self.conn.execute("SELECT name, roll_no, grade FROM students INDEXED BY students_roll"
+                                " WHERE roll_no = ?", (str(roll_no),)).fetchone()
+        return _student(row) if row else None
+
+    def by_grade(self, grade):
+        # insertion order, like StudentRegistry; the index is already in that order
+        cur = self.conn.execute("SELECT name, roll_no, grade FROM students WHERE grade = ? ORDER BY id",
+                                (str(grade),))
+        return [_student(row) for row in cur]
+
+    def count_grade(self, grade):
+        return self.conn.execute("SELECT count(*) FROM students WHERE grade = ?",
+                                 (str(grade),)).fetchone()[0]
+
+    def search_name_prefix(self, prefix, limit=None):
+        prefix = prefix.lower()
+        sql = ("SELECT name, roll_no, grade FROM students WHERE name_key >= ? AND name_key < ?"
+               " ORDER BY name_key, roll_no")
+        args = (prefix, prefix + "\U0010ffff")
+        if limit is not None:
+            sql += " LIMIT ?"
+            args += (limit,)
+        return [_student(row) for row in self.conn.execute(sql, args)]
+
+
+class StudentRows:
+    """
+    Read-only sequence view of the students table in insertion order, enough
+    for school.listing: len() and slices.  Ids are 1..n with no gaps (rows are
+    never deleted and a failed bulk load rolls back), so a slice is an id range.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def __len__(self):
+        return self.conn.execute("SELECT coalesce(max(id), 0) FROM students").fetchone()[0]
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            raise TypeError("StudentRows only supports slicing")
+        start, stop, _ = index.indices(len(self))
+        cur = self.conn.execute("SELECT name, roll_no, grade FROM students"
+                                " WHERE id > ? AND id <= ? ORDER BY id", (start, stop))
+        return [_student(row) for row in cur]
+
+
+def _create_index(name, columns):
+    return f"CREATE INDEX IF NOT EXISTS {name} ON students ({', '.join(columns)})"
+
+
+def _student(row):
+    return {"name": row[0], "roll_no": row[1], "grade": row[2]}
@@ -1,14 +1,42 @@
-students = []
+import csv
+
+from .listing import render
+from .registry import registry
+
+STUDENT_ROW = "Name: {name}, Roll No: {roll_no}, Grade: {grade}"
 
 def add_student(name, roll_no, grade):
-    students.append({"name": name, "roll_no": roll_no, "grade": grade})
+    try:
+        registry.add_student(name, roll_no, grade)
+    except ValueError as e:
+        print(f"Cannot add student: {e}")
+        return
     print(f"Student added: {name} (Roll No: {roll_no}, Grade: {grade})")
 
-def list_students():
-    if not students:
-        print("No students found.")
-    else:
-        print("\n--- Student List ---")
-        for s in students:
-            print(f"Name: {s['name']}, Roll No: {s['roll_no']}, Grade: {s['grade']}")
-        print("--------------------\n")
+def print_students(rows, title="Student List", **paging):
+    return render(rows, STUDENT_ROW, title, "No students found.", **paging)
+
+def list_students(page=None, page_size=None, cursor=None, out=None):
+    return print_students(registry.students.rows, page=page, page_size=page_size, cursor=cursor, out=out)
+
+def import_students(path):
+    """Bulk-load a CSV roster with name, roll_no and grade columns."""
+    with open(path, newline="", encoding="utf-8") as f:
+        rows = ((r["name"], r["roll_no"], r["grade"]) for r in csv.DictReader(f))
+        try:
+            count = registry.add_students(rows)
+        except (ValueError, KeyError) as e:
+            print(f"Cannot import students: {e}")
+            return 0
+    print(f"Imported {count} students from {path}")
+    return count
+
+def find_student(roll_no):
+    s = registry.students.get_by_roll(roll_no)
+    print_students([s] if s else [], f"Roll No {roll_no}")
+
+def list_students_by_grade(grade):
+    print_students(registry.students.by_grade(grade), f"Grade {grade}")
+
+def search_students(prefix):
+    print_students(registry.students.search_name_prefix(prefix), f"Names starting with '{prefix}'")
@@ -1,14 +1,18 @@
-subjects = []
+from .listing import render
+from .registry import registry
+
+SUBJECT_ROW = "Name: {name}, Code: {code}"
+
+subjects = registry.subjects
 
 def add_subject(name, code):
-    subjects.append({"name": name, "code": code})
+    try:
+        registry.add_subject(name, code)
+    except ValueError as e:
+        print(f"Cannot add subject: {e}")
+        return
     print(f"Subject added: {name} (Code: {code})")
 
-def list_subjects():
-    if not subjects:
-        print("No subjects found.")
-    else:
-        print("\n--- Subject List ---")
-        for s in subjects:
-            print(f"Name: {s['name']}, Code: {s['code']}")
-        print("--------------------\n")
+def list_subjects(page=None, page_size=None, cursor=None, out=None):
+    return render(subjects, SUBJECT_ROW, "Subject List", "No subjects found.",
+                  page=page, page_size=page_size, cursor=cursor, out=out)
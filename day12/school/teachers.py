@@ -1,14 +1,20 @@
-teachers = []
+from .listing import render
+from .registry import registry
 
-def add_teacher(name, subject):
-    teachers.append({"name": name, "subject": subject})
+TEACHER_ROW = "Name: {name}, Subject: {subject}"
+
+teachers = registry.teachers
+
+def add_teacher(name, subject, grades=()):
+    registry.add_teacher(name, subject, grades)
     print(f"Teacher added: {name} (Subject: {subject})")
 
-def list_teachers():
-    if not teachers:
-        print("No teachers found.")
-    else:
-        print("\n--- Teacher List ---")
-        for t in teachers:
-            print(f"Name: {t['name']}, Subject: {t['subject']}")
-        print("--------------------\n")
+def list_teachers(page=None, page_size=None, cursor=None, out=None):
+    return render(teachers, TEACHER_ROW, "Teacher List", "No teachers found.",
+                  page=page, page_size=page_size, cursor=cursor, out=out)
+
+def list_teachers_for_subject(code):
+    rows = [{"name": t["name"], "load": registry.student_load(t["id"])}
+            for t in registry.teachers_for_subject(code)]
+    render(rows, "Name: {name}, Students: {load}", f"Teachers for {code}",
+           f"No teachers found for {code}.")
@@ -0,0 +1,151 @@
+# tests/conftest.py
+# Local stub weather servers.  Run from day12/: python -m pytest -q
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+
+def weather_body(city):
+    return json.dumps({"name": city,
+                       "main": {"temp": 21.5, "feels_like": 20.0, "humidity": 55},
+                       "weather": [{"main": "Clouds", "description": "few clouds"}]}).encode()
+
+
+class HTTPStub:
+    """
+    Threaded HTTP/1.1 stub.  `script` is a list of (status, delay) pairs
+    served in order, then 200s; every request's client address is recorded.
+    """
+
+    def __init__(self):
+        self.script = []
+        self.requests = []
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                with stub.lock:
+                    stub.requests.append(self.client_address)
+                    status, delay = stub.script.pop(0) if stub.script else (200, 0)
+                time.sleep(delay)
+                city = parse_qs(urlparse(self.path).query)["q"][0]
+                body = weather_body(city) if status == 200 else b'{"message": "busy"}'
+                try:
+                    self.send_response(status)
+                    if status == 429:
+                        self.send_header("Retry-After", "0")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                except OSError:
+                    pass   # client gave up (timeout tests)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/data/2.5/weather"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    @property
+    def connections(self):
+        return len(set(self.requests))
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class AsyncStub:
+    """
+    asyncio HTTP/1.1 stub that injects latency per city (`delays`, seconds),
+    answers 404 for cities in `missing` and 503 with Retry-After for cities
+    in `busy` (city -> seconds).  Tracks requests per city and
+    the highest number of requests in flight at once.
+    """
+
+    def __init__(self):
+        self.delays = {}
+        self.missing = set()
+        self.busy = {}
+        self.hits = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self.loop)
+            self.server = self.loop.run_until_complete(asyncio.start_server(self.handle, "127.0.0.1", 0))
+            ready.set()
+            self.loop.run_forever()
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+        ready.wait()
+        self.url = f"http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}/data/2.5/weather"
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                city = parse_qs(urlparse(head.split(b" ")[1].decode()).query)["q"][0]
+                self.hits[city] = self.hits.get(city, 0) + 1
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                try:
+                    await asyncio.sleep(self.delays.get(city, 0.1))
+                finally:
+                    self.in_flight -= 1
+                headers = ""
+                if city in self.missing:
+                    status, body = "404 Not Found", b'{"message": "city not found"}'
+                elif city in self.busy:
+                    status, body = "503 Service Unavailable", b'{"message": "busy"}'
+                    headers = f"Retry-After: {self.busy[city]}\r\n"
+                else:
+                    status, body = "200 OK", weather_body(city)
+                writer.write(f"HTTP/1.1 {status}\r\n{headers}Content-Length: {len(body)}\r\n\r\n".encode()
+                             + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def shutdown(self):
+        self.server.close()
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.loop.stop()
+
+    def close(self):
+        asyncio.run_coroutine_threadsafe(self.shutdown(), self.loop)
+        self.thread.join()
+        self.loop.close()
+
+
+@pytest.fixture
+def http_stub():
+    stub = HTTPStub()
+    yield stub
+    stub.close()
+
+
+@pytest.fixture
+def async_stub():
+    stub = AsyncStub()
+    yield stub
+    stub.close()
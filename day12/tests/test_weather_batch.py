@@ -0,0 +1,68 @@
+# tests/test_weather_batch.py
+import asyncio
+import time
+
+import pytest
+
+pytest.importorskip("requests")
+
+from weather.api import WeatherClient
+from weather.batch import fetch_weather_many
+
+
+def run_many(stub, cities, retries=0, **kwargs):
+    with WeatherClient(base_url=stub.url, retries=retries, backoff=0.1,
+                       pool_size=kwargs.get("concurrency", 10)) as client:
+        return asyncio.run(fetch_weather_many(cities, api_key="k", client=client,
+                                              use_cache=False, coalesce=False, **kwargs))
+
+
+def test_concurrency_is_bounded(async_stub):
+    cities = [f"City{i}" for i in range(20)]
+    start = time.perf_counter()
+    report = run_many(async_stub, cities, concurrency=4)
+    elapsed = time.perf_counter() - start
+    assert list(report["results"]) == cities
+    assert async_stub.max_in_flight == 4
+    assert 0.45 < elapsed < 2.0    # 5 waves of 100 ms, not 20 sequential round-trips
+
+
+def test_timeouts_do_not_starve_other_cities(async_stub):
+    async_stub.delays.update({"Slow1": 3, "Slow2": 3})
+    cities = ["Slow1", "Slow2", "A", "B", "C", "D"]
+    report = run_many(async_stub, cities, concurrency=2, timeout=1)
+    assert set(report["errors"]) == {"Slow1", "Slow2"}
+    assert list(report["results"]) == ["A", "B", "C", "D"]
+    assert report["elapsed_s"] < 2.5
+
+
+def test_retry_after_does_not_outlast_the_deadline(async_stub):
+    async_stub.busy["Slow"] = 6
+    async_stub.delays["A"] = 0.01
+    start = time.perf_counter()
+    report = run_many(async_stub, ["Slow", "A"], retries=3, concurrency=1, timeout=2)
+    assert time.perf_counter() - start < 3.5   # not 3 x 6 s of Retry-After
+    assert list(report["results"]) == ["A"]
+    assert list(report["errors"]) == ["Slow"]  # 503, or the deadline if the last try ends on it
+    assert async_stub.hits["Slow"] >= 2        # it did retry, within the budget
+
+
+def test_partial_failure_is_reported(async_stub):
+    async_stub.missing.add("Nowhere")
+    report = run_many(async_stub, ["Pune", "Nowhere", "Goa"], concurrency=3)
+    assert list(report["results"]) == ["Pune", "Goa"]
+    assert list(report["errors"]) == ["Nowhere"]
+    assert "404" in report["errors"]["Nowhere"]
+    assert "appid" not in report["errors"]["Nowhere"]
+
+
+def test_duplicate_cities_fetched_once(async_stub):
+    report = run_many(async_stub, ["Pune", " Pune ", "Goa", "Pune", ""], concurrency=5)
+    assert list(report["results"]) == ["Pune", "Goa"]
+    assert async_stub.hits == {"Pune": 1, "Goa": 1}
+
+
+def test_mock_without_api_key():
+    report = asyncio.run(fetch_weather_many(["pune", "goa"]))
+    assert [d["city"] for d in report["results"].values()] == ["Pune", "Goa"]
+    assert report["errors"] == {}
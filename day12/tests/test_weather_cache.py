@@ -0,0 +1,31 @@
+# tests/test_weather_cache.py
+from weather.cache import WeatherCache
+
+
+def test_lru_order_is_shared_by_memory_and_database(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = WeatherCache(path, max_entries=2)
+    cache.put("A", {"city": "A"})
+    cache.put("B", {"city": "B"})
+    assert cache.get("A") == {"city": "A"}   # served from memory
+    cache.put("C", {"city": "C"})
+    assert list(cache._mem) == ["a|metric", "c|metric"]
+    assert cache.stats()["evictions"] == 1
+    cache.close()
+
+    reopened = WeatherCache(path, max_entries=2)
+    assert reopened.get("A") == {"city": "A"}
+    assert reopened.get("B") is None
+    assert reopened.get("C") == {"city": "C"}
+    reopened.close()
+
+
+def test_memory_only_cache_evicts_least_recently_used():
+    cache = WeatherCache(None, max_entries=2)
+    cache.put("A", {"city": "A"})
+    cache.put("B", {"city": "B"})
+    cache.get("A")
+    cache.put("C", {"city": "C"})
+    assert cache.get("B") is None
+    assert cache.get("A") and cache.get("C")
+    assert cache.stats()["evictions"] == 1
@@ -0,0 +1,55 @@
+# tests/test_weather_client.py
+import time
+
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from weather.api import WeatherClient, fetch_weather
+
+
+def test_session_reuses_one_connection(http_stub):
+    with WeatherClient(base_url=http_stub.url) as client:
+        for city in ["Pune", "Delhi", "Goa"] * 5:
+            assert fetch_weather(city, api_key="k", client=client, use_cache=False)["city"] == city
+    assert len(http_stub.requests) == 15
+    assert http_stub.connections == 1
+
+
+@pytest.mark.parametrize("status", [503, 429])
+def test_retries_on_busy_statuses(http_stub, status):
+    http_stub.script = [(status, 0), (status, 0)]
+    with WeatherClient(base_url=http_stub.url, retries=3, backoff=0.01) as client:
+        data = client.current("Pune", api_key="k")
+    assert data["temp_c"] == 21.5
+    assert len(http_stub.requests) == 3
+
+
+def test_gives_up_after_retries(http_stub):
+    http_stub.script = [(503, 0)] * 5
+    with WeatherClient(base_url=http_stub.url, retries=2, backoff=0.01) as client:
+        with pytest.raises(requests.HTTPError) as err:
+            client.current("Pune", api_key="secret")
+    assert len(http_stub.requests) == 3
+    assert "secret" not in str(err.value)
+    assert err.value.response.status_code == 503
+
+
+def test_read_timeout(http_stub):
+    http_stub.script = [(200, 2)]
+    with WeatherClient(base_url=http_stub.url, timeout=0.2, retries=0) as client:
+        start = time.perf_counter()
+        with pytest.raises(requests.RequestException) as err:
+            client.current("Pune", api_key="secret")
+    assert time.perf_counter() - start < 1.5
+    assert "secret" not in str(err.value)
+    assert err.value.request is not None
+
+
+def test_budget_caps_retries(http_stub):
+    http_stub.script = [(200, 2)] * 4
+    with WeatherClient(base_url=http_stub.url, timeout=10, retries=3, backoff=0.01) as client:
+        start = time.perf_counter()
+        with pytest.raises(requests.RequestException):
+            client.current("Pune", api_key="k", budget=0.8)
+    assert time.perf_counter() - start < 1.5
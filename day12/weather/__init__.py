@@ -2,7 +2,29 @@
 """
 Weather package initialization
 Provides tools to fetch and display weather data.
+
+Names are loaded on first use (PEP 562), so importing the package, or
+running `python -m weather.cli`, doesn't import every submodule up front.
 """
 
-from .api import fetch_weather
-from .formatter import format_weather_short, format_weather_verbose
+_EXPORTS = {
+    "fetch_weather": ".api",
+    "WeatherClient": ".api",
+    "format_weather_short": ".formatter",
+    "format_weather_verbose": ".formatter",
+    "HistoryStore": ".history",
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,37 +2,226 @@
 weather.api
 Responsible for calling external APIs (OpenWeatherMap).
 If api_key is None, returns mocked data for testing.
+
+Real calls go through a WeatherClient, which keeps one requests.Session so
+connections (and their TCP+TLS handshakes) are reused across lookups.
+fetch_weather() uses a module-level default client, and answers from the
+per-city cache (weather.cache) while an entry is fresh.  Concurrent
+lookups for the same city share one request (weather.flight), and an
+entry that has only just expired can be served at once while a background
+request refreshes it (stale-while-revalidate).
+
+requests and the cache are imported on the first real API call, so mock
+runs and --help never pay for them.
 """
 
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple, Union
+import threading
 import time
 import os
 
-try:
-    import requests
-except Exception:
-    requests = None
+from .flight import SingleFlight
+
+if TYPE_CHECKING:
+    from .cache import WeatherCache
+
+def _requests():
+    try:
+        import requests
+    except Exception:
+        raise RuntimeError("requests library required for real API calls. Install with: pip install requests") from None
+    return requests
+
+# OpenWeatherMap current weather endpoint (example)
+DEFAULT_URL = "https://api.openweathermap.org/data/2.5/weather"
+
+Timeout = Union[float, Tuple[float, float]]
+
+class WeatherClient:
+    """
+    Reusable HTTP client for the weather endpoint.
+
+    - one requests.Session with a keep-alive pool of `pool_size` connections
+    - GETs retried up to `retries` times on connection errors and
+      429/5xx responses, sleeping backoff * 2**n between tries
+      (a Retry-After header is honoured)
+    - `timeout` is (connect, read) seconds, or one number for both
+
+    `base_url` can point at any compatible server, e.g. a local stub.
+    Use as a context manager, or call close() when done.
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, api_key: Optional[str] = None, base_url: str = DEFAULT_URL,
+                 timeout: Timeout = (3.05, 10), retries: int = 3, backoff: float = 0.3,
+                 pool_size: int = 20, units: str = "metric"):
+        requests = _requests()
+        from requests.adapters import HTTPAdapter
+        self.api_key = api_key
+        self.base_url = base_url
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.units = units
+        self.session = requests.Session()
+        retry = _budget_retry_class()(total=retries, connect=retries, read=retries, status=retries,
+                      backoff_factor=backoff, status_forcelist=self.RETRY_STATUSES,
+                      allowed_methods=frozenset(["GET"]), raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def attempt_timeout(self, budget: float) -> Timeout:
+        """
+        Per-attempt (connect, read) timeout so that every retry plus the
+        backoff sleeps between them fit in `budget` seconds overall.
+        The budget is also enforced as a deadline: no retry starts (and no
+        Retry-After wait is taken) that would run past it.
+        """
+        # urllib3 sleeps backoff * 2**(n-1) before the n-th consecutive retry, none before the first
+        sleeps = sum(self.backoff * 2 ** (n - 1) for n in range(2, self.retries + 1))
+        per_attempt = max((budget - sleeps) / (self.retries + 1), 0.05)
+        connect, read = self.timeout if isinstance(self.timeout, tuple) else (self.timeout, self.timeout)
+        return min(connect, per_attempt), min(read, per_attempt)
+
+    def current(self, city: str, api_key: Optional[str] = None,
+                budget: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Current weather for `city`, simplified like fetch_weather().
+        `budget` caps the whole call, retries included (see attempt_timeout()).
+        """
+        params = {"q": city, "appid": api_key or self.api_key, "units": self.units}
+        timeout = self.timeout if budget is None else self.attempt_timeout(budget)
+        _deadline.at = None if budget is None else time.monotonic() + budget
+        try:
+            resp = self.session.get(self.base_url, params=params, timeout=timeout)
+        except _requests().RequestException as e:
+            # transport errors quote the URL too; mask the key in the message
+            raise _masked(e, params["appid"]) from None
+        finally:
+            _deadline.at = None
+        if resp.status_code >= 400:
+            # not raise_for_status(): its message carries the URL, api key included
+            raise _requests().HTTPError(f"{resp.status_code} {resp.reason} for city {city!r}", response=resp)
+        return _simplify(resp.json())
+
+    def close(self) -> None:
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# deadline (time.monotonic()) of the budgeted call running in this thread
+_deadline = threading.local()
+_retry_class = None
+
+def _budget_retry_class():
+    """
+    urllib3 Retry that stops at the calling thread's deadline: while one is
+    set, Retry-After is ignored (backoff only) and the retries count as
+    exhausted once the next backoff would reach the deadline.
+    """
+    global _retry_class
+    if _retry_class is None:
+        from urllib3.util.retry import Retry
+
+        class BudgetRetry(Retry):
+            def is_exhausted(self) -> bool:
+                at = getattr(_deadline, "at", None)
+                if at is not None and time.monotonic() + self.get_backoff_time() >= at:
+                    return True
+                return super().is_exhausted()
+
+            def sleep(self, response=None) -> None:
+                if getattr(_deadline, "at", None) is not None:
+                    response = None
+                super().sleep(response)
+
+        _retry_class = BudgetRetry
+    return _retry_class
+
+def _masked(e: Exception, secret: Optional[str]) -> Exception:
+    """`e` with `secret` scrubbed from its message; type, request and response are kept."""
+    if secret:
+        e.args = tuple(str(a).replace(secret, "***") for a in e.args)
+    return e
+
+_default_client = None
+_default_lock = threading.Lock()
+
+def default_client() -> WeatherClient:
+    """The shared client used by fetch_weather(), created on first use."""
+    global _default_client
+    if _default_client is None:
+        with _default_lock:
+            if _default_client is None:
+                _default_client = WeatherClient()
+    return _default_client
+
+def set_default_client(client: Optional[WeatherClient]) -> None:
+    """Replace the shared client (None: build a fresh one on next use)."""
+    global _default_client
+    with _default_lock:
+        old, _default_client = _default_client, client
+    if old is not None and old is not client:
+        old.close()
+
+# shared by every fetch_weather() call in the process
+flights = SingleFlight()
+
+def flight_stats() -> Dict[str, int]:
+    """upstream_calls made, saved_calls (callers that shared one), background_refreshes."""
+    return flights.stats()
 
 # alias-style exported name for use by other modules
-def fetch_weather(city: str, api_key: Optional[str] = None) -> Dict[str, Any]:
+def fetch_weather(city: str, api_key: Optional[str] = None,
+                  client: Optional[WeatherClient] = None,
+                  cache: Optional["WeatherCache"] = None, use_cache: bool = True,
+                  ttl: Optional[float] = None, coalesce: bool = True,
+                  stale_for: float = 0.0, budget: Optional[float] = None) -> Dict[str, Any]:
     """
     Return a dict with simplified weather info for `city`.
     If api_key is None, return mock data.
+
+    A fresh cached entry for (city, units) is returned without a network
+    call; otherwise the result is fetched and cached for `ttl` seconds
+    (default: the cache's ttl).  use_cache=False skips the cache both ways.
+
+    coalesce: concurrent calls for the same city wait on one request.
+    stale_for: an entry expired less than this many seconds ago is returned
+    straight away and refreshed in the background.
+    budget: seconds allowed for the HTTP call, retries included.
     """
     if not api_key:
         return _mock_weather(city)
 
-    if requests is None:
-        raise RuntimeError("requests library required for real API calls. Install with: pip install requests")
+    from .cache import cache_key, default_cache
+    client = client or default_client()
+    key = (client.base_url, cache_key(city, client.units))
+    if not use_cache:
+        fetch = lambda: client.current(city, api_key=api_key, budget=budget)
+        return flights.do(key, fetch) if coalesce else flights.run(fetch)
+
+    cache = cache or default_cache()
+    data, fresh = cache.lookup(city, client.units, stale_for=stale_for)
+    if fresh:
+        return data
+
+    def fetch():
+        result = client.current(city, api_key=api_key, budget=budget)
+        cache.put(city, result, client.units, ttl=ttl)
+        return result
 
-    # OpenWeatherMap current weather endpoint (example)
-    url = "https://api.openweathermap.org/data/2.5/weather"
-    params = {"q": city, "appid": api_key, "units": "metric"}
-    resp = requests.get(url, params=params, timeout=10)
-    resp.raise_for_status()
-    data = resp.json()
+    if data is not None:
+        flights.start(key, fetch)
+        return data
+    return flights.do(key, fetch) if coalesce else flights.run(fetch)
 
-    # simplify the response
+def _simplify(data: Dict[str, Any]) -> Dict[str, Any]:
     return {
         "city": data.get("name"),
         "temp_c": data["main"]["temp"],
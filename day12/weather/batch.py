@@ -0,0 +1,87 @@
+"""
+weather.batch
+Fetch many cities concurrently.
+
+fetch_weather_many() is a coroutine that runs fetch_weather() calls on a
+thread pool of `concurrency` workers, bounded by a semaphore, with a
+deadline per request.  The deadline is also handed to the HTTP call as
+its time budget, and a city keeps its slot until its worker has really
+finished, so an abandoned request never eats into another city's
+deadline.  All calls share one pooled WeatherClient, so connections are
+reused across cities.  One city failing does not stop the
+others: failures are collected and reported next to the results.
+"""
+
+import asyncio
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+
+from .api import WeatherClient, fetch_weather
+
+def read_cities(path: str) -> List[str]:
+    """City names from a file: one per line, blank lines and '#' comments skipped."""
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+def split_cities(text: str) -> List[str]:
+    """City names from a comma-separated string."""
+    return [c.strip() for c in text.split(",") if c.strip()]
+
+async def fetch_weather_many(cities: Iterable[str], api_key: Optional[str] = None,
+                             concurrency: int = 10, timeout: float = 15.0,
+                             client: Optional[WeatherClient] = None,
+                             use_cache: bool = True, coalesce: bool = True,
+                             stale_for: float = 0.0) -> Dict[str, Any]:
+    """
+    Fetch every city (duplicates once) with at most `concurrency` requests
+    in flight, giving each up to `timeout` seconds.
+
+    Returns {"results": {city: data}, "errors": {city: message},
+             "elapsed_s": float}; both dicts follow the input order.
+    Without an api_key every city gets mock data, as with fetch_weather();
+    fresh cached cities are answered without a request unless use_cache=False.
+    coalesce and stale_for are passed on to fetch_weather().
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    cities = list(dict.fromkeys(c.strip() for c in cities if c and c.strip()))
+    start = time.perf_counter()
+    own_client = client is None and bool(api_key)
+    if own_client:
+        client = WeatherClient(api_key=api_key, pool_size=concurrency)
+
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(concurrency)
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="weather")
+
+    async def one(city):
+        async with sem:
+            call = loop.run_in_executor(pool, functools.partial(
+                fetch_weather, city, api_key=api_key, client=client, use_cache=use_cache,
+                coalesce=coalesce, stale_for=stale_for, budget=timeout))
+            try:
+                return await asyncio.wait_for(asyncio.shield(call), timeout)
+            except asyncio.TimeoutError:
+                # the worker stops on its own soon (it has the same budget);
+                # hold the slot until it does
+                await asyncio.gather(call, return_exceptions=True)
+                raise
+
+    try:
+        outcomes = await asyncio.gather(*(one(c) for c in cities), return_exceptions=True)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+        if own_client:
+            client.close()
+
+    results, errors = {}, {}
+    for city, outcome in zip(cities, outcomes):
+        if isinstance(outcome, asyncio.TimeoutError):
+            errors[city] = f"timed out after {timeout}s"
+        elif isinstance(outcome, BaseException):
+            errors[city] = str(outcome) or type(outcome).__name__
+        else:
+            results[city] = outcome
+    return {"results": results, "errors": errors, "elapsed_s": time.perf_counter() - start}
@@ -0,0 +1,77 @@
+"""
+weather.bench
+Cold-start budget for the weather CLI.
+Usage (from day12/): python -m weather.bench [--runs N] [--budget-ms MS]
+
+In fresh interpreters it measures the cumulative `-X importtime` cost of
+`import weather.cli` (median of N runs) and the wall time of a mock CLI
+run.  It exits 1 if the import goes over budget, if a module that should
+load lazily is imported on the mock path, or if the mock run (with --ttl)
+touches the cache directory.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# must not be imported by `import weather.cli` or a mock lookup
+LAZY_MODULES = ("requests", "urllib3", "json", "sqlite3", "asyncio", "concurrent.futures")
+
+def import_time_us(module: str = "weather.cli") -> int:
+    """Cumulative import time of `module` in a fresh interpreter, in microseconds."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          capture_output=True, text=True, check=True)
+    for line in proc.stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1])
+    raise RuntimeError(f"no importtime line for {module}")
+
+def eager_modules() -> list:
+    """LAZY_MODULES that a mock lookup through the CLI module loads anyway."""
+    code = ("import sys, weather.cli as c; c.main(['Pune']); "
+            f"print('eager:' + ','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))")
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    line = proc.stdout.strip().splitlines()[-1]
+    return [m for m in line[len("eager:"):].split(",") if m]
+
+def mock_run(home: str) -> float:
+    env = dict(os.environ, HOME=home)
+    env.pop("OPENWEATHER_API_KEY", None)
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "weather.cli", "Pune", "--ttl", "60"], env=env,
+                   capture_output=True, check=True)
+    return time.perf_counter() - t0
+
+def run(runs: int = 7, budget_ms: float = 40.0) -> dict:
+    imports = sorted(import_time_us() for _ in range(runs))
+    with tempfile.TemporaryDirectory() as home:
+        walls = sorted(mock_run(home) for _ in range(runs))
+        touched_cache = (Path(home) / ".weather_cache").exists()
+    result = {
+        "import_ms_median": statistics.median(imports) / 1000,
+        "import_ms_min": imports[0] / 1000,
+        "mock_run_ms_median": statistics.median(walls) * 1000,
+        "budget_ms": budget_ms,
+        "eager_modules": eager_modules(),
+        "touched_cache_dir": touched_cache,
+    }
+    result["ok"] = (result["import_ms_median"] <= budget_ms
+                    and not result["eager_modules"] and not touched_cache)
+    return result
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(prog="weather.bench", description="Weather CLI cold-start benchmark")
+    p.add_argument("--runs", type=int, default=7)
+    p.add_argument("--budget-ms", type=float, default=40.0,
+                   help="Max median import time of weather.cli (default 40)")
+    args = p.parse_args()
+    result = run(args.runs, args.budget_ms)
+    for k, v in result.items():
+        print(f"{k:20}: {v:.2f}" if isinstance(v, float) else f"{k:20}: {v}")
+    sys.exit(0 if result["ok"] else 1)
@@ -0,0 +1,188 @@
+"""
+weather.cache
+Keyed weather cache: one entry per (city, units), each with its own TTL,
+least-recently-used entries evicted above `max_entries`.
+
+Entries live in a small SQLite file (by default ~/.weather_cache/cache.db)
+so they survive between CLI runs, with an in-process LRU dict in front so
+repeated lookups in one process never read the database.  Every hit still
+stamps the entry's last_used there, and eviction picks the least recently
+used keys from the database and drops the same keys from memory, so both
+layers agree on what was used last.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+
+DEFAULT_CACHE_PATH = Path.home() / ".weather_cache" / "cache.db"
+DEFAULT_TTL = 600.0
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+"""
+
+def cache_key(city: str, units: str = "metric") -> str:
+    return f"{' '.join(city.split()).lower()}|{units}"
+
+class WeatherCache:
+    """
+    get() returns a fresh entry or None; put() stores one.  Expired entries
+    count as misses, unless lookup() is allowed to return them as stale.
+    Counters: hits, stale, misses, evictions (see stats()).
+    `path=None` keeps the cache in memory only.  Safe to share between threads.
+    """
+
+    def __init__(self, path: Union[str, Path, None] = DEFAULT_CACHE_PATH,
+                 ttl: float = DEFAULT_TTL, max_entries: int = 1000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = self.stale = self.misses = self.evictions = 0
+        self._lock = threading.Lock()
+        self._mem = OrderedDict()   # key -> (expires_at, data), most recent last
+        self.conn = None
+        if path is not None:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            self.conn = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(SCHEMA)
+
+    def get(self, city: str, units: str = "metric") -> Optional[Dict[str, Any]]:
+        return self.lookup(city, units)[0]
+
+    def lookup(self, city: str, units: str = "metric",
+               stale_for: float = 0.0) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        (data, True) for a fresh entry; (data, False) for one that expired
+        less than `stale_for` seconds ago; (None, False) otherwise.
+        """
+        key = cache_key(city, units)
+        now = time.time()
+        with self._lock:
+            entry = self._lookup(key, now)
+            if entry is not None and entry[0] > now:
+                self.hits += 1
+                return entry[1], True
+            if entry is not None and now - entry[0] < stale_for:
+                self.stale += 1
+                return entry[1], False
+            self.misses += 1
+            return None, False
+
+    def _lookup(self, key, now):
+        entry = self._mem.get(key)
+        if entry is not None:
+            self._mem.move_to_end(key)
+            if self.conn is not None:
+                self.conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (now, key))
+            return entry
+        if self.conn is None:
+            return None
+        row = self.conn.execute("SELECT expires_at, data FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self.conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (now, key))
+        entry = (row[0], json.loads(row[1]))
+        self._remember(key, entry)
+        return entry
+
+    def put(self, city: str, data: Dict[str, Any], units: str = "metric",
+            ttl: Optional[float] = None) -> None:
+        key = cache_key(city, units)
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._remember(key, (expires_at, data))
+            if self.conn is not None:
+                self.conn.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                                  (key, json.dumps(data), now, expires_at, now))
+                self._evict_db()
+
+    def _remember(self, key, entry):
+        self._mem[key] = entry
+        self._mem.move_to_end(key)
+        # with a database, _evict_db() evicts; memory only drops entries the
+        # database still holds (possible when other processes add entries)
+        while len(self._mem) > self.max_entries:
+            self._mem.popitem(last=False)
+            if self.conn is None:
+                self.evictions += 1
+
+    def _evict_db(self):
+        count = self.conn.execute("SELECT count(*) FROM entries").fetchone()[0]
+        extra = count - self.max_entries
+        if extra > 0:
+            keys = [k for (k,) in self.conn.execute(
+                "SELECT key FROM entries ORDER BY last_used, stored_at LIMIT ?", (extra,))]
+            self.conn.executemany("DELETE FROM entries WHERE key = ?", [(k,) for k in keys])
+            for k in keys:
+                self._mem.pop(k, None)
+            self.evictions += len(keys)
+
+    def last(self) -> Optional[Dict[str, Any]]:
+        """The most recently stored entry, fresh or not (what --use-cache shows)."""
+        with self._lock:
+            if self.conn is not None:
+                row = self.conn.execute("SELECT data FROM entries ORDER BY stored_at DESC LIMIT 1").fetchone()
+                return json.loads(row[0]) if row else None
+            return next(reversed(self._mem.values()))[1] if self._mem else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._mem.clear()
+            if self.conn is not None:
+                self.conn.execute("DELETE FROM entries")
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "stale": self.stale, "misses": self.misses,
+                "evictions": self.evictions}
+
+    def close(self) -> None:
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+_default_cache = None
+_default_options: Dict[str, Any] = {}
+_default_lock = threading.Lock()
+
+def default_cache() -> WeatherCache:
+    """The shared cache used by fetch_weather(), opened on first use."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_lock:
+            if _default_cache is None:
+                _default_cache = WeatherCache(**_default_options)
+    return _default_cache
+
+def configure_default_cache(**options) -> None:
+    """
+    WeatherCache options (e.g. ttl=60) for the shared cache.  Nothing is
+    opened here: they apply when default_cache() is first used, or at once
+    to a shared cache that is already open.
+    """
+    with _default_lock:
+        _default_options.update(options)
+        if _default_cache is not None:
+            for name, value in options.items():
+                setattr(_default_cache, name, value)
+
+def set_default_cache(cache: Optional[WeatherCache]) -> None:
+    """Replace the shared cache (None: open the default file on next use)."""
+    global _default_cache
+    with _default_lock:
+        old, _default_cache = _default_cache, cache
+    if old is not None and old is not cache:
+        old.close()
@@ -3,48 +3,118 @@ Entry point for the weather CLI.
 Run with: python -m weather.cli   (from parent folder)
 """
 
+import sys
+
 from . import api as api_mod               # alias import
 from .formatter import format_weather_short as fmt_short, format_weather_verbose as fmt_verbose
-from .helpers.utils import parse_args, get_api_key_from_env, save_cache, load_cache
+from .helpers.utils import parse_args, get_api_key_from_env
 
 def main(argv=None):
     args = parse_args(argv)
+    if args.ttl is not None:
+        from .cache import configure_default_cache
+        configure_default_cache(ttl=args.ttl)
+    try:
+        if args.cities or args.cities_file:
+            return run_many(args)
+        return run_one(args)
+    finally:
+        # let stale-while-revalidate refreshes land in the cache before exiting
+        api_mod.flights.wait(timeout=args.timeout)
+        if args.cache_stats:
+            if not args.no_cache:
+                from .cache import default_cache
+                stats = default_cache().stats()
+                print(f"Cache: {stats['hits']} hits, {stats['stale']} stale, {stats['misses']} misses",
+                      file=sys.stderr)
+            stats = api_mod.flight_stats()
+            print(f"Upstream: {stats['upstream_calls']} calls, {stats['saved_calls']} saved by coalescing, "
+                  f"{stats['background_refreshes']} background refreshes", file=sys.stderr)
+
+def open_history(args, api_key):
+    """
+    (store, record): the history store if results will be recorded or
+    trends shown, else None.  Only real API results are recorded; mock
+    data would just add noise.
+    """
+    record = bool(api_key) and not args.no_history
+    if not record and not (args.verbose and args.trends):
+        return None, False
+    from .history import HistoryStore
+    return HistoryStore(), record
+
+def show(data, args, history=None):
+    if args.verbose:
+        print(fmt_verbose(data, history if args.trends else None))
+    else:
+        print(fmt_short(data))
 
+def run_one(args):
     # determine city
     if not args.city:
-        # try previous cached city first
-        if args.use_cache:
-            cached = load_cache()
-            if cached and cached.get("city"):
-                city = cached["city"]
-            else:
-                city = input("Enter city: ").strip()
-        else:
-            city = input("Enter city: ").strip()
+        # show the last cached result without calling the API
+        if args.use_cache and not args.no_cache:
+            from .cache import default_cache
+            cached = default_cache().last()
+            if cached:
+                print(fmt_verbose(cached) if args.verbose else fmt_short(cached))
+                return
+        city = input("Enter city: ").strip()
     else:
         city = args.city
 
     # api key: CLI arg -> env var -> None (mock)
     api_key = args.api_key or get_api_key_from_env()
 
-    # fetch weather
+    # fetch weather (served from the cache while fresh)
     try:
-        data = api_mod.fetch_weather(city, api_key=api_key)
+        data = api_mod.fetch_weather(city, api_key=api_key, use_cache=not args.no_cache,
+                                     coalesce=not args.no_coalesce, stale_for=args.stale_for)
     except Exception as e:
         print(f"Error fetching weather: {e}")
         return
 
-    # save cache for convenience
+    # keep the observation, then print according to verbosity
+    history, record = open_history(args, api_key)
     try:
-        save_cache(data)
-    except Exception:
-        pass
+        if record:
+            history.record(data)
+        show(data, args, history)
+    finally:
+        if history is not None:
+            history.close()
 
-    # print according to verbosity
-    if args.verbose:
-        print(fmt_verbose(data))
-    else:
-        print(fmt_short(data))
+def run_many(args):
+    """Fetch a list of cities concurrently; returns 1 if any of them failed."""
+    import asyncio
+    from .batch import fetch_weather_many, read_cities, split_cities
+
+    cities = []
+    if args.city:
+        cities.append(args.city)
+    if args.cities:
+        cities += split_cities(args.cities)
+    if args.cities_file:
+        cities += read_cities(args.cities_file)
+    api_key = args.api_key or get_api_key_from_env()
+
+    report = asyncio.run(fetch_weather_many(cities, api_key=api_key, concurrency=args.concurrency,
+                                            timeout=args.timeout, use_cache=not args.no_cache,
+                                            coalesce=not args.no_coalesce, stale_for=args.stale_for))
+    history, record = open_history(args, api_key)
+    try:
+        for data in report["results"].values():
+            if record:
+                history.record(data)
+            show(data, args, history)
+    finally:
+        if history is not None:
+            history.close()
+    for city, err in report["errors"].items():
+        print(f"Error fetching weather for {city}: {err}", file=sys.stderr)
+    total = len(report["results"]) + len(report["errors"])
+    print(f"Fetched {len(report['results'])}/{total} cities in {report['elapsed_s']:.2f}s", file=sys.stderr)
+    return 1 if report["errors"] else 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,89 @@
+"""
+weather.flight
+Request coalescing ("singleflight") for blocking calls.
+
+While a call for some key is running, other threads asking for the same
+key wait for it and share its result (or its exception) instead of making
+their own call.  start() runs a call in the background unless one for that
+key is already in flight, which is how stale cache entries get refreshed.
+"""
+
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """Counters: calls (actually run), shared (callers served by another's call), background."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._threads = []
+        self.calls = self.shared = self.background = 0
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.shared += 1
+        if leader:
+            self._run(key, call, fn)
+        else:
+            call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def run(self, fn: Callable[[], Any]) -> Any:
+        """Call fn without coalescing; only counted."""
+        with self._lock:
+            self.calls += 1
+        return fn()
+
+    def start(self, key: Hashable, fn: Callable[[], Any]) -> bool:
+        """Run fn in a background thread unless `key` is in flight; True if started."""
+        with self._lock:
+            if key in self._calls:
+                self.shared += 1
+                return False
+            call = self._calls[key] = _Call()
+            self.calls += 1
+            self.background += 1
+            self._threads = [t for t in self._threads if t.is_alive()]
+            t = threading.Thread(target=self._run, args=(key, call, fn), daemon=True)
+            self._threads.append(t)
+        # a failed refresh only leaves the stale entry in place; the next caller retries
+        t.start()
+        return True
+
+    def _run(self, key, call, fn):
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def wait(self, timeout: float = None) -> None:
+        """Wait for background calls started so far (e.g. before the CLI exits)."""
+        with self._lock:
+            threads = list(self._threads)
+        for t in threads:
+            t.join(timeout)
+
+    def stats(self) -> Dict[str, int]:
+        return {"upstream_calls": self.calls, "saved_calls": self.shared,
+                "background_refreshes": self.background}
@@ -4,7 +4,10 @@ Formatting helpers to make CLI output nice.
 """
 
 from datetime import datetime
-from typing import Dict
+from typing import TYPE_CHECKING, Dict, Optional
+
+if TYPE_CHECKING:
+    from .history import HistoryStore
 
 def format_weather_short(data: Dict) -> str:
     city = data.get("city", "Unknown")
@@ -12,7 +15,11 @@ def format_weather_short(data: Dict) -> str:
     w = data.get("weather_desc", "")
     return f"{city}: {t}°C — {w}"
 
-def format_weather_verbose(data: Dict) -> str:
+def format_weather_verbose(data: Dict, history: Optional["HistoryStore"] = None) -> str:
+    """
+    Multi-line report.  With a weather.history.HistoryStore, adds today's
+    range and the change since the same hour yesterday (from its rollups).
+    """
     city = data.get("city", "Unknown")
     t = data.get("temp_c")
     feels = data.get("feels_like_c")
@@ -22,9 +29,17 @@ def format_weather_verbose(data: Dict) -> str:
     ts = data.get("timestamp")
     time_str = datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S") if ts else "N/A"
 
-    return (
+    report = (
         f"Weather for {city} at {time_str}\n"
         f"  Condition : {main} — {desc}\n"
         f"  Temperature: {t}°C (feels like {feels}°C)\n"
         f"  Humidity   : {hum}%\n"
     )
+    trend = history.trend(city, now=ts) if history is not None and city else None
+    if trend and trend["today"]:
+        today = trend["today"]
+        report += (f"  Today      : {today['min']:.1f}–{today['max']:.1f}°C, "
+                   f"mean {today['mean']:.1f}°C ({today['count']} readings)\n")
+    if trend and trend["change_24h"] is not None:
+        report += f"  Vs 24h ago : {trend['change_24h']:+.1f}°C\n"
+    return report
@@ -1,37 +1,34 @@
 """
-Utility helpers for CLI argument parsing, caching, and small helpers.
+Utility helpers for CLI argument parsing and small helpers.
+(Cached results live in weather.cache.)
 """
 
 import argparse
 import os
-import json
-from pathlib import Path
-from typing import Tuple, Optional, Dict, Any
-
-CACHE_DIR = Path.home() / ".weather_cache"
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
-CACHE_FILE = CACHE_DIR / "last.json"
+from typing import Optional
 
 def parse_args(argv=None) -> argparse.Namespace:
     p = argparse.ArgumentParser(prog="weather", description="Console Weather Report")
     p.add_argument("city", nargs="?", help="City name (e.g. London)")
     p.add_argument("-k", "--api-key", dest="api_key", help="OpenWeatherMap API key (optional)")
     p.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
-    p.add_argument("--use-cache", action="store_true", help="Use cached last result if available")
+    p.add_argument("--use-cache", action="store_true", help="With no city, show the last cached result")
+    p.add_argument("--no-cache", action="store_true", help="Always call the API; don't read or write the cache")
+    p.add_argument("--ttl", type=float, help="Seconds to keep fetched results in the cache (default 600)")
+    p.add_argument("--stale-for", type=float, default=0.0,
+                   help="Serve results expired less than this many seconds ago while refreshing them")
+    p.add_argument("--no-coalesce", action="store_true",
+                   help="Don't share one request between identical concurrent lookups")
+    p.add_argument("--no-history", action="store_true",
+                   help="Don't record fetched results in the history store")
+    p.add_argument("--trends", action="store_true",
+                   help="With -v, show today's range and the 24h change from recorded history")
+    p.add_argument("--cache-stats", action="store_true", help="Print cache and upstream call counts when done")
+    p.add_argument("--cities", help="Comma-separated cities to fetch concurrently")
+    p.add_argument("--cities-file", help="File with one city per line to fetch concurrently")
+    p.add_argument("-j", "--concurrency", type=int, default=10, help="Parallel requests for --cities/--cities-file")
+    p.add_argument("--timeout", type=float, default=15.0, help="Seconds allowed per city for --cities/--cities-file")
     return p.parse_args(argv)
 
-def save_cache(data: Dict[str, Any]) -> None:
-    with open(CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f)
-
-def load_cache() -> Optional[Dict[str, Any]]:
-    if not CACHE_FILE.exists():
-        return None
-    try:
-        with open(CACHE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception:
-        return None
-
 def get_api_key_from_env() -> Optional[str]:
     return os.environ.get("OPENWEATHER_API_KEY")
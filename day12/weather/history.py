@@ -0,0 +1,262 @@
+"""
+weather.history
+Append-only history of weather observations, stored column by column.
+
+Each city gets a directory of typed-array column files (array module,
+native byte order), one value appended per observation:
+
+    ts (int64 unix s) | temp_c (float64) | feels_like_c (float64, nan if
+    unknown) | humidity (int16, -1 if unknown) | condition (uint16 code)
+
+City names and condition strings ("Clear", "Rain", ...) are interned in
+"cities.txt" / "conditions.txt", one per line in id order.  Observations
+for a city are kept in timestamp order (older or repeated timestamps, e.g.
+a cached result, are skipped), so range queries are two binary searches.
+
+Hourly and daily (local time) count/min/max/sum rollups of temp_c and
+humidity are kept up to date on every record() and saved to
+"rollups.json" on close; opening the store only folds in rows appended
+after that checkpoint.
+"""
+
+import json
+import math
+import os
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_HISTORY_DIR = Path.home() / ".weather_cache" / "history"
+
+COLUMNS = (("ts", "q"), ("temp_c", "d"), ("feels_like_c", "d"),
+           ("humidity", "h"), ("condition", "H"))
+METRICS = ("temp_c", "humidity")
+GRANULARITIES = ("hour", "day")
+
+def city_key(city: str) -> str:
+    return " ".join(city.split()).lower()
+
+def bucket_keys(ts: int) -> Tuple[str, str]:
+    """("2025-03-14T09", "2025-03-14") for a unix timestamp, local time."""
+    d = datetime.fromtimestamp(ts)
+    return d.strftime("%Y-%m-%dT%H"), d.strftime("%Y-%m-%d")
+
+class CitySeries:
+    """One city's columns plus its rollups."""
+
+    def __init__(self, directory: Path):
+        self.dir = directory
+        self.cols = {name: array(code) for name, code in COLUMNS}
+        # granularity -> bucket key -> {metric: [count, min, max, sum]}
+        self.rollups = {g: {} for g in GRANULARITIES}
+        self.rolled = 0   # rows folded into self.rollups
+
+    def load(self):
+        for name, code in COLUMNS:
+            path = self.dir / f"{name}.bin"
+            col = self.cols[name] = array(code)
+            if path.exists():
+                with open(path, "rb") as f:
+                    col.frombytes(f.read())
+        # a crash between column writes can leave some columns one row longer
+        n = len(self)
+        for name, col in self.cols.items():
+            if len(col) > n:
+                del col[n:]
+                with open(self.dir / f"{name}.bin", "r+b") as f:
+                    f.truncate(n * col.itemsize)
+
+    def __len__(self):
+        return min(len(c) for c in self.cols.values())
+
+    def append(self, row: Dict[str, Any]) -> None:
+        self.dir.mkdir(parents=True, exist_ok=True)
+        for name, code in COLUMNS:
+            value = array(code, [row[name]])
+            self.cols[name].extend(value)
+            with open(self.dir / f"{name}.bin", "ab") as f:
+                value.tofile(f)
+        self._roll(len(self) - 1)
+
+    def _roll(self, i: int) -> None:
+        ts = self.cols["ts"][i]
+        for g, key in zip(GRANULARITIES, bucket_keys(ts)):
+            bucket = self.rollups[g].setdefault(key, {})
+            for m in METRICS:
+                v = self.cols[m][i]
+                if (m == "humidity" and v < 0) or (m != "humidity" and math.isnan(v)):
+                    continue
+                agg = bucket.get(m)
+                if agg is None:
+                    bucket[m] = [1, v, v, v]
+                else:
+                    agg[0] += 1
+                    agg[1] = min(agg[1], v)
+                    agg[2] = max(agg[2], v)
+                    agg[3] += v
+        self.rolled = i + 1
+
+    def catch_up(self) -> None:
+        for i in range(self.rolled, len(self)):
+            self._roll(i)
+
+class HistoryStore:
+    """
+    record(data) appends a fetch_weather() result; range() returns raw
+    columns between two timestamps; rollup() and trend() answer from the
+    hourly/daily buckets only.
+    """
+
+    def __init__(self, path=DEFAULT_HISTORY_DIR):
+        self.path = Path(path)
+        self.cities: List[str] = self._read_names("cities.txt")
+        self.city_ids = {c: i for i, c in enumerate(self.cities)}
+        self.conditions: List[str] = self._read_names("conditions.txt")
+        self.condition_ids = {c: i for i, c in enumerate(self.conditions)}
+        self._series: Dict[int, CitySeries] = {}
+        self._saved_rollups = self._load_rollups()
+
+    def _read_names(self, filename):
+        p = self.path / filename
+        if not p.exists():
+            return []
+        with open(p, "r", encoding="utf-8", newline="") as f:
+            return f.read().split("\n")[:-1]
+
+    def _intern(self, names, ids, filename, name):
+        i = ids.get(name)
+        if i is None:
+            self.path.mkdir(parents=True, exist_ok=True)
+            i = ids[name] = len(names)
+            names.append(name)
+            with open(self.path / filename, "a", encoding="utf-8", newline="") as f:
+                f.write(name.replace("\n", " ") + "\n")
+        return i
+
+    def series(self, city: str) -> Optional[CitySeries]:
+        """The city's columns, loaded on first use; None if never recorded."""
+        cid = self.city_ids.get(city_key(city))
+        if cid is None:
+            return None
+        return self._open_series(cid)
+
+    def _open_series(self, cid):
+        s = self._series.get(cid)
+        if s is None:
+            s = self._series[cid] = CitySeries(self.path / str(cid))
+            s.load()
+            saved = self._saved_rollups.get(str(cid))
+            if saved and saved["rows"] <= len(s):
+                s.rollups = saved["rollups"]
+                s.rolled = saved["rows"]
+            s.catch_up()
+        return s
+
+    def record(self, data: Dict[str, Any]) -> bool:
+        """Append one observation; False if it isn't newer than the city's last one."""
+        city = data.get("city")
+        ts = data.get("timestamp")
+        if not city or ts is None or data.get("temp_c") is None:
+            return False
+        cid = self._intern(self.cities, self.city_ids, "cities.txt", city_key(city))
+        s = self._open_series(cid)
+        ts = int(ts)
+        if len(s) and ts <= s.cols["ts"][len(s) - 1]:
+            return False
+        feels = data.get("feels_like_c")
+        humidity = data.get("humidity")
+        s.append({
+            "ts": ts,
+            "temp_c": float(data["temp_c"]),
+            "feels_like_c": math.nan if feels is None else float(feels),
+            "humidity": -1 if humidity is None else int(humidity),
+            "condition": self._intern(self.conditions, self.condition_ids, "conditions.txt",
+                                      data.get("weather_main") or ""),
+        })
+        return True
+
+    def range(self, city: str, start: Optional[int] = None, end: Optional[int] = None) -> Dict[str, array]:
+        """Columns for observations with start <= ts < end (either bound may be None)."""
+        s = self.series(city)
+        if s is None:
+            return {name: array(code) for name, code in COLUMNS}
+        n = len(s)
+        ts = s.cols["ts"]
+        lo = 0 if start is None else bisect_left(ts, start, 0, n)
+        hi = n if end is None else bisect_left(ts, end, lo, n)
+        out = {name: col[lo:hi] for name, col in s.cols.items()}
+        out["condition_name"] = [self.conditions[c] for c in out["condition"]]
+        return out
+
+    def rollup(self, city: str, granularity: str = "day", metric: str = "temp_c",
+               start: Optional[str] = None, end: Optional[str] = None) -> List[Tuple]:
+        """
+        [(bucket key, count, min, max, mean)] in key order for one metric.
+        `start`/`end` are bucket keys ("2025-03-14" or "2025-03-14T09"),
+        end exclusive.
+        """
+        if granularity not in GRANULARITIES or metric not in METRICS:
+            raise ValueError(f"granularity must be one of {GRANULARITIES}, metric one of {METRICS}")
+        s = self.series(city)
+        if s is None:
+            return []
+        out = []
+        for key in sorted(s.rollups[granularity]):
+            if (start and key < start) or (end and key >= end):
+                continue
+            agg = s.rollups[granularity][key].get(metric)
+            if agg:
+                out.append((key, agg[0], agg[1], agg[2], agg[3] / agg[0]))
+        return out
+
+    def trend(self, city: str, now: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Today's temp_c count/min/max/mean, and the change between this hour's
+        mean and the same hour yesterday.  Reads four buckets, no raw rows.
+        """
+        s = self.series(city)
+        if s is None or not len(s):
+            return None
+        now = int(now if now is not None else s.cols["ts"][len(s) - 1])
+        hour, day = bucket_keys(now)
+        prev_hour, prev_day = bucket_keys(now - 86400)
+
+        def stat(g, key):
+            agg = s.rollups[g].get(key, {}).get("temp_c")
+            return None if not agg else {"count": agg[0], "min": agg[1], "max": agg[2],
+                                         "mean": agg[3] / agg[0]}
+
+        today, yesterday = stat("day", day), stat("day", prev_day)
+        this_hour, last_day_hour = stat("hour", hour), stat("hour", prev_hour)
+        change = None
+        if this_hour and last_day_hour:
+            change = this_hour["mean"] - last_day_hour["mean"]
+        return {"today": today, "yesterday": yesterday, "change_24h": change}
+
+    def close(self) -> None:
+        """Save rollup checkpoints so the next open doesn't re-roll old rows."""
+        if not self._series:
+            return
+        data = dict(self._saved_rollups)
+        for cid, s in self._series.items():
+            data[str(cid)] = {"rows": s.rolled, "rollups": s.rollups}
+        self.path.mkdir(parents=True, exist_ok=True)
+        tmp = self.path / "rollups.json.tmp"
+        tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, self.path / "rollups.json")
+        self._saved_rollups = data
+
+    def _load_rollups(self):
+        try:
+            data = json.loads((self.path / "rollups.json").read_text(encoding="utf-8"))
+            return data if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()